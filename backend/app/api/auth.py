@@ -150,7 +150,11 @@ async def logout(token: str):
         
         con.execute("DELETE FROM sessions WHERE token = ?", (token,))
         con.commit()
-    
+
+    # 세션 캐시에서도 즉시 제거 (TTL 남은 토큰이 계속 통과하는 것 방지)
+    from backend.app.api.invoices import invalidate_session
+    invalidate_session(token)
+
     # 로그 기록
     if nickname:
         add_log(
@@ -372,7 +376,11 @@ async def delete_user(user_id: int, token: str):
         con.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
         con.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
         con.commit()
-    
+
+    # user_id로 지운 세션은 토큰을 모르므로 캐시 전체 무효화
+    from backend.app.api.invoices import invalidate_session
+    invalidate_session()
+
     # 로그 기록
     add_log(
         action_type="사용자 삭제",
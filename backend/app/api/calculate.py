@@ -254,7 +254,11 @@ async def calculate_invoice(req: InvoiceCalculateRequest, token: Optional[str] =
                     )
                 
                 con.commit()
-        
+
+            # 목록 캐시 무효화 — 새 인보이스가 5초 TTL을 기다리지 않고 바로 보이게
+            from backend.app.api.invoices import _bump_invoices_version
+            _bump_invoices_version()
+
         # 로그 기록
         add_log(
             action_type="인보이스 생성",
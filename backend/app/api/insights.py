@@ -4,29 +4,112 @@ backend/app/api/insights.py - 데이터 인사이트 API
 """
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional, Dict, Any
+import functools
 import pandas as pd
 from datetime import datetime
 
 from logic.db import get_connection
 
-router = APIRouter(prefix="/insights", tags=["insights"])
+# Arrow 백엔드 문자열 (문자열 groupby/contains 가속, 미설치 시 기존 object dtype 유지)
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# orjson 기반 직렬화 (목록형 응답 직렬화 가속, 미설치 시 기본 JSONResponse 유지)
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _ResponseClass
+
+router = APIRouter(prefix="/insights", tags=["insights"], default_response_class=_ResponseClass)
+
+# 컬럼명 후보 (업로드 파일마다 스키마가 달라서 후보 중 첫 번째 존재 컬럼 사용)
+DATE_COL_CANDIDATES = ["배송일", "송장등록일", "출고일자", "기록일자"]
+COL_CANDIDATES = {
+    'vendor': ["공급처", "업체", "vendor"],
+    'item': ["상품명", "어드민상품명", "상품", "item"],
+    'qty': ["수량", "qty", "Qty"],
+    'amount': ["정산예정금액", "총금액", "금액", "amount"],
+}
+VENDOR_COL_CANDIDATES = COL_CANDIDATES['vendor']
 
 
 # ─────────────────────────────────────
 # Helper Functions
 # ─────────────────────────────────────
 
-def get_shipping_data(period: Optional[str] = None) -> pd.DataFrame:
-    """배송 통계 데이터 로드"""
+# PRAGMA table_info 캐시 (업로드로 스키마가 바뀔 수 있어 60초 TTL)
+_SCHEMA_CACHE = {"ts": 0.0, "cols": []}
+_SCHEMA_TTL = 60.0
+
+# 기간 목록 캐시 (월 단위로만 바뀌므로 5분 TTL + 행 수 변화 감지)
+_PERIODS_CACHE = {"ts": 0.0, "rowcount": -1, "data": []}
+_PERIODS_TTL = 300.0
+
+
+def _shipping_periods(con, date_col: str) -> list:
+    """shipping_stats의 년월(DISTINCT) 목록 조회 (캐시됨)
+
+    TTL이 남아 있어도 행 수가 바뀌면(업로드/삭제) 즉시 갱신한다.
+    """
+    import time
+    now = time.monotonic()
+    rowcount = con.execute("SELECT COUNT(*) FROM shipping_stats").fetchone()[0]
+    if now - _PERIODS_CACHE["ts"] > _PERIODS_TTL or rowcount != _PERIODS_CACHE["rowcount"]:
+        _PERIODS_CACHE["data"] = [r[0] for r in con.execute(
+            f"SELECT DISTINCT strftime('%Y-%m', [{date_col}]) AS ym FROM shipping_stats"
+            " WHERE ym IS NOT NULL ORDER BY ym DESC"
+        )]
+        _PERIODS_CACHE["ts"] = now
+        _PERIODS_CACHE["rowcount"] = rowcount
+    return _PERIODS_CACHE["data"]
+
+
+def _shipping_table_columns(con) -> list:
+    """shipping_stats 실제 컬럼 목록 조회 (캐시됨)"""
+    import time
+    now = time.monotonic()
+    if now - _SCHEMA_CACHE["ts"] > _SCHEMA_TTL:
+        _SCHEMA_CACHE["cols"] = [c[1] for c in con.execute("PRAGMA table_info(shipping_stats);")]
+        _SCHEMA_CACHE["ts"] = now
+    return _SCHEMA_CACHE["cols"]
+
+
+def get_shipping_data(period: Optional[str] = None, cols_needed: Optional[set] = None) -> pd.DataFrame:
+    """배송 통계 데이터 로드
+
+    cols_needed: 논리 컬럼 키 집합 ('vendor'/'item'/'qty'/'amount').
+    지정하면 해당 컬럼(+날짜 컬럼)만 SELECT해서 이동 데이터량을 줄인다.
+    """
     with get_connection() as con:
-        df = pd.read_sql("SELECT * FROM shipping_stats", con)
-    
+        if cols_needed:
+            table_cols = _shipping_table_columns(con)
+            select_cols = []
+            for key in cols_needed:
+                col = next((c for c in COL_CANDIDATES.get(key, []) if c in table_cols), None)
+                if col:
+                    select_cols.append(col)
+            # 날짜 컬럼은 기간 필터/년월 계산에 항상 필요
+            date_sel = next((c for c in DATE_COL_CANDIDATES if c in table_cols), None)
+            if date_sel and date_sel not in select_cols:
+                select_cols.append(date_sel)
+            if not select_cols:
+                return pd.DataFrame()
+            sel = ", ".join(f"[{c}]" for c in select_cols)
+            df = pd.read_sql(f"SELECT {sel} FROM shipping_stats", con)
+        else:
+            df = pd.read_sql("SELECT * FROM shipping_stats", con)
+
     if df.empty:
         return df
-    
+
+    df = _use_arrow_strings(df)
+
     # 날짜 컬럼 찾기 및 변환
-    date_cols = ["배송일", "송장등록일", "출고일자", "기록일자"]
-    date_col = next((c for c in date_cols if c in df.columns), None)
+    date_col = next((c for c in DATE_COL_CANDIDATES if c in df.columns), None)
     
     if date_col:
         df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
@@ -39,62 +122,116 @@ def get_shipping_data(period: Optional[str] = None) -> pd.DataFrame:
     return df
 
 
-def detect_columns(df: pd.DataFrame) -> Dict[str, Optional[str]]:
-    """컬럼명 자동 감지"""
+def _use_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """object 문자열 컬럼을 Arrow 백엔드 string dtype으로 변환
+
+    str.contains / groupby / nunique 등 문자열 연산이 Arrow 커널(C++)로 실행됨.
+    """
+    if _HAS_PYARROW:
+        for c in df.select_dtypes(include='object').columns:
+            try:
+                df[c] = df[c].astype('string[pyarrow]')
+            except (TypeError, ValueError):
+                pass  # 혼합 타입 컬럼은 그대로 둠
+    return df
+
+
+def _read_sql_fast(con, sql: str, params=None) -> pd.DataFrame:
+    """드라이버 fetchall → DataFrame 직접 구성
+
+    pd.read_sql의 행 단위 래핑(_wrap_result) 오버헤드를 건너뛰고
+    커서 결과를 한 번에 DataFrame으로 만든다.
+    """
+    cur = con.execute(sql, params or [])
+    rows = cur.fetchall()
+    cols = [d[0] for d in cur.description]
+    return _use_arrow_strings(pd.DataFrame(rows, columns=cols))
+
+
+def _to_json_records(df: pd.DataFrame, int_cols=(), float_cols=(), str_cols=()) -> List[dict]:
+    """컬럼 단위 일괄 캐스팅 후 to_dict('records')로 변환
+
+    행 루프의 per-cell int()/float()/str() 호출을 벡터화된 astype 한 번으로 대체한다.
+    """
+    for c in int_cols:
+        df[c] = df[c].astype('int64')
+    for c in float_cols:
+        df[c] = df[c].astype('float64')
+    for c in str_cols:
+        df[c] = df[c].astype(str)
+    return df.to_dict('records')
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_columns_cached(columns: tuple) -> Dict[str, Optional[str]]:
+    """컬럼 튜플 기준 감지 결과 캐시 (같은 스키마면 재탐색 없음)"""
     return {
-        'vendor': next((c for c in ["공급처", "업체", "vendor"] if c in df.columns), None),
-        'item': next((c for c in ["상품명", "어드민상품명", "상품", "item"] if c in df.columns), None),
-        'qty': next((c for c in ["수량", "qty", "Qty"] if c in df.columns), None),
-        'amount': next((c for c in ["정산예정금액", "총금액", "금액", "amount"] if c in df.columns), None),
+        key: next((c for c in candidates if c in columns), None)
+        for key, candidates in COL_CANDIDATES.items()
     }
 
 
+def detect_columns(df: pd.DataFrame) -> Dict[str, Optional[str]]:
+    """컬럼명 자동 감지"""
+    return _detect_columns_cached(tuple(df.columns))
+
+
 # ─────────────────────────────────────
 # API Endpoints
 # ─────────────────────────────────────
 
 @router.get("/summary")
-async def get_summary(period: Optional[str] = None):
-    """핵심 지표 요약"""
-    df = get_shipping_data(period)
-    
-    if df.empty:
-        return {
-            "total_orders": 0,
-            "total_qty": 0,
-            "total_vendors": 0,
-            "total_amount": 0,
-            "periods": []
-        }
-    
-    cols = detect_columns(df)
-    
-    # 수량 숫자 변환
-    if cols['qty']:
-        df[cols['qty']] = pd.to_numeric(df[cols['qty']], errors='coerce').fillna(0)
-    
-    # 금액 숫자 변환
-    if cols['amount'] and cols['amount'] in df.columns:
-        df[cols['amount']] = pd.to_numeric(df[cols['amount']], errors='coerce').fillna(0)
-    
-    # 사용 가능한 기간 목록
-    periods = []
-    if '년월' in df.columns:
-        periods = sorted(df['년월'].dropna().unique().tolist(), reverse=True)
-    
+def get_summary(period: Optional[str] = None):
+    """핵심 지표 요약 (테이블 로드 없이 SQL 집계만 사용)"""
+    with get_connection() as con:
+        table_cols = _shipping_table_columns(con)
+        qty_col = next((c for c in COL_CANDIDATES['qty'] if c in table_cols), None)
+        vendor_col = next((c for c in COL_CANDIDATES['vendor'] if c in table_cols), None)
+        amount_col = next((c for c in COL_CANDIDATES['amount'] if c in table_cols), None)
+        date_col = next((c for c in DATE_COL_CANDIDATES if c in table_cols), None)
+
+        aggs = [
+            "COUNT(*)",
+            f"SUM(CAST([{qty_col}] AS REAL))" if qty_col else "0",
+            f"COUNT(DISTINCT [{vendor_col}])" if vendor_col else "0",
+            f"SUM(CAST([{amount_col}] AS REAL))" if amount_col else "0",
+        ]
+
+        where = ""
+        params = []
+        if period and period != "전체" and date_col:
+            where = f" WHERE strftime('%Y-%m', [{date_col}]) = ?"
+            params.append(period)
+
+        row = con.execute(
+            f"SELECT {', '.join(aggs)} FROM shipping_stats{where}", params
+        ).fetchone()
+
+        periods = []
+        if date_col:
+            if where:
+                # 기간 필터가 있으면 필터 조건대로 직접 조회 (캐시 미적용)
+                periods = [r[0] for r in con.execute(
+                    f"SELECT DISTINCT strftime('%Y-%m', [{date_col}]) AS ym FROM shipping_stats"
+                    + where + " AND ym IS NOT NULL ORDER BY ym DESC",
+                    params
+                )]
+            else:
+                periods = _shipping_periods(con, date_col)
+
     return {
-        "total_orders": len(df),
-        "total_qty": int(df[cols['qty']].sum()) if cols['qty'] else 0,
-        "total_vendors": int(df[cols['vendor']].nunique()) if cols['vendor'] else 0,
-        "total_amount": int(df[cols['amount']].sum()) if cols['amount'] and cols['amount'] in df.columns else 0,
+        "total_orders": int(row[0] or 0),
+        "total_qty": int(row[1] or 0),
+        "total_vendors": int(row[2] or 0),
+        "total_amount": int(row[3] or 0),
         "periods": periods
     }
 
 
 @router.get("/top-products")
-async def get_top_products(period: Optional[str] = None, limit: int = 20):
+def get_top_products(period: Optional[str] = None, limit: int = 20):
     """인기 상품 TOP N"""
-    df = get_shipping_data(period)
+    df = get_shipping_data(period, cols_needed={'item', 'qty'})
     
     if df.empty:
         return []
@@ -112,21 +249,15 @@ async def get_top_products(period: Optional[str] = None, limit: int = 20):
                     .sort_values(cols['qty'], ascending=False)
                     .head(limit))
     
-    result = []
-    for idx, row in top_products.iterrows():
-        result.append({
-            "rank": len(result) + 1,
-            "product": str(row[cols['item']]),
-            "quantity": int(row[cols['qty']])
-        })
-    
-    return result
+    top_products = top_products.rename(columns={cols['item']: 'product', cols['qty']: 'quantity'})
+    top_products.insert(0, 'rank', range(1, len(top_products) + 1))
+    return _to_json_records(top_products, int_cols=('rank', 'quantity'), str_cols=('product',))
 
 
 @router.get("/top-vendors-by-qty")
-async def get_top_vendors_by_qty(period: Optional[str] = None, limit: int = 20):
+def get_top_vendors_by_qty(period: Optional[str] = None, limit: int = 20):
     """거래처별 출고량 TOP N"""
-    df = get_shipping_data(period)
+    df = get_shipping_data(period, cols_needed={'vendor', 'qty'})
     
     if df.empty:
         return []
@@ -139,29 +270,24 @@ async def get_top_vendors_by_qty(period: Optional[str] = None, limit: int = 20):
     df[cols['qty']] = pd.to_numeric(df[cols['qty']], errors='coerce').fillna(0)
     
     vendor_stats = (df.groupby(cols['vendor'])
-                    .agg({cols['qty']: ['sum', 'count']})
-                    .reset_index())
-    vendor_stats.columns = ['vendor', 'total_qty', 'order_count']
+                    .agg(total_qty=(cols['qty'], 'sum'),
+                         order_count=(cols['qty'], 'count'))
+                    .reset_index()
+                    .rename(columns={cols['vendor']: 'vendor'}))
     vendor_stats = vendor_stats.sort_values('total_qty', ascending=False).head(limit)
     vendor_stats['avg_qty_per_order'] = (vendor_stats['total_qty'] / vendor_stats['order_count']).round(1)
     
-    result = []
-    for idx, row in vendor_stats.iterrows():
-        result.append({
-            "rank": len(result) + 1,
-            "vendor": str(row['vendor']),
-            "total_qty": int(row['total_qty']),
-            "order_count": int(row['order_count']),
-            "avg_qty_per_order": float(row['avg_qty_per_order'])
-        })
-    
-    return result
+    vendor_stats.insert(0, 'rank', range(1, len(vendor_stats) + 1))
+    return _to_json_records(vendor_stats,
+                            int_cols=('rank', 'total_qty', 'order_count'),
+                            float_cols=('avg_qty_per_order',),
+                            str_cols=('vendor',))
 
 
 @router.get("/top-vendors-by-revenue")
-async def get_top_vendors_by_revenue(period: Optional[str] = None, limit: int = 20):
+def get_top_vendors_by_revenue(period: Optional[str] = None, limit: int = 20):
     """거래처별 매출 TOP N"""
-    df = get_shipping_data(period)
+    df = get_shipping_data(period, cols_needed={'vendor', 'amount'})
     
     if df.empty:
         return []
@@ -174,29 +300,23 @@ async def get_top_vendors_by_revenue(period: Optional[str] = None, limit: int =
     df[cols['amount']] = pd.to_numeric(df[cols['amount']], errors='coerce').fillna(0)
     
     revenue_stats = (df.groupby(cols['vendor'])
-                    .agg({cols['amount']: ['sum', 'count']})
-                    .reset_index())
-    revenue_stats.columns = ['vendor', 'total_revenue', 'order_count']
+                    .agg(total_revenue=(cols['amount'], 'sum'),
+                         order_count=(cols['amount'], 'count'))
+                    .reset_index()
+                    .rename(columns={cols['vendor']: 'vendor'}))
     revenue_stats = revenue_stats.sort_values('total_revenue', ascending=False).head(limit)
     revenue_stats['avg_order_value'] = (revenue_stats['total_revenue'] / revenue_stats['order_count']).round(0)
     
-    result = []
-    for idx, row in revenue_stats.iterrows():
-        result.append({
-            "rank": len(result) + 1,
-            "vendor": str(row['vendor']),
-            "total_revenue": int(row['total_revenue']),
-            "order_count": int(row['order_count']),
-            "avg_order_value": int(row['avg_order_value'])
-        })
-    
-    return result
+    revenue_stats.insert(0, 'rank', range(1, len(revenue_stats) + 1))
+    return _to_json_records(revenue_stats,
+                            int_cols=('rank', 'total_revenue', 'order_count', 'avg_order_value'),
+                            str_cols=('vendor',))
 
 
 @router.get("/monthly-trend")
-async def get_monthly_trend():
+def get_monthly_trend():
     """월별 트렌드"""
-    df = get_shipping_data()
+    df = get_shipping_data(cols_needed={'qty', 'vendor', 'amount'})
     
     if df.empty or '년월' not in df.columns:
         return []
@@ -207,50 +327,45 @@ async def get_monthly_trend():
         return []
     
     df[cols['qty']] = pd.to_numeric(df[cols['qty']], errors='coerce').fillna(0)
-    
-    monthly_stats = df.groupby('년월').agg({
-        cols['qty']: 'sum',
-        cols['vendor']: 'count' if cols['vendor'] else lambda x: len(x)
-    }).reset_index()
-    monthly_stats.columns = ['period', 'total_qty', 'order_count']
-    
-    if cols['amount'] and cols['amount'] in df.columns:
+
+    has_amount = bool(cols['amount'] and cols['amount'] in df.columns)
+    if has_amount:
         df[cols['amount']] = pd.to_numeric(df[cols['amount']], errors='coerce').fillna(0)
-        monthly_revenue = df.groupby('년월')[cols['amount']].sum().reset_index()
-        monthly_revenue.columns = ['period', 'total_revenue']
-        monthly_stats = monthly_stats.merge(monthly_revenue, on='period')
-    
-    monthly_stats = monthly_stats.sort_values('period')
-    
+
+    # 수량/건수/매출을 groupby 한 번으로 집계 (named agg → MultiIndex rename/merge 불필요)
+    named_aggs = {
+        'total_qty': (cols['qty'], 'sum'),
+        'order_count': (cols['vendor'] if cols['vendor'] else cols['qty'], 'count'),
+    }
+    if has_amount:
+        named_aggs['total_revenue'] = (cols['amount'], 'sum')
+
+    monthly_stats = df.groupby('년월', sort=True).agg(**named_aggs).reset_index()
+    monthly_stats = monthly_stats.rename(columns={'년월': 'period'})
+
     # 성장률 계산
     monthly_stats['qty_growth'] = monthly_stats['total_qty'].pct_change() * 100
     
-    result = []
-    for _, row in monthly_stats.iterrows():
-        item = {
-            "period": row['period'],
-            "total_qty": int(row['total_qty']),
-            "order_count": int(row['order_count']),
-            "qty_growth": round(row['qty_growth'], 1) if pd.notna(row['qty_growth']) else None
-        }
-        if 'total_revenue' in row:
-            item['total_revenue'] = int(row['total_revenue'])
-        result.append(item)
-    
+    monthly_stats['qty_growth'] = monthly_stats['qty_growth'].round(1)
+    int_cols = ['total_qty', 'order_count'] + (['total_revenue'] if has_amount else [])
+    result = _to_json_records(monthly_stats, int_cols=int_cols)
+    for item in result:
+        if pd.isna(item['qty_growth']):
+            item['qty_growth'] = None
     return result
 
 
 @router.get("/our-revenue")
-async def get_our_revenue(period: Optional[str] = None):
+def get_our_revenue(period: Optional[str] = None):
     """우리 매출 분석 (인보이스 기반)"""
     try:
         with get_connection() as con:
             # 날짜 필터
             date_filter = ""
             if period and period != "전체":
-                date_filter = f"AND strftime('%Y-%m', i.period_from) = '{period}'"
+                date_filter = f"AND substr(i.period_from, 1, 7) = '{period}'"
             
-            df_invoice = pd.read_sql(f"""
+            df_invoice = _read_sql_fast(con, f"""
                 SELECT 
                     i.invoice_id,
                     v.vendor as vendor,
@@ -270,7 +385,7 @@ async def get_our_revenue(period: Optional[str] = None):
                 WHERE i.status != 'cancelled'
                   AND (v.active IS NULL OR v.active = 'YES')
                 {date_filter}
-            """, con)
+            """)
         
         if df_invoice.empty:
             return {
@@ -288,13 +403,12 @@ async def get_our_revenue(period: Optional[str] = None):
         )
         
         # 거래처별 집계
-        vendor_stats = df_invoice.groupby(['vendor', 'vendor_name']).agg({
-            'invoice_id': 'count',
-            'amount': 'sum',
-            'base_order_count': 'sum',
-            'order_value': 'mean'
-        }).reset_index()
-        vendor_stats.columns = ['vendor', 'vendor_name', 'invoice_count', 'total_revenue', 'total_orders', 'avg_order_value']
+        vendor_stats = df_invoice.groupby(['vendor', 'vendor_name']).agg(
+            invoice_count=('invoice_id', 'count'),
+            total_revenue=('amount', 'sum'),
+            total_orders=('base_order_count', 'sum'),
+            avg_order_value=('order_value', 'mean'),
+        ).reset_index()
         vendor_stats = vendor_stats.sort_values('total_revenue', ascending=False)
         
         # 전체 통계
@@ -303,17 +417,14 @@ async def get_our_revenue(period: Optional[str] = None):
         total_orders = int(vendor_stats['total_orders'].sum())
         avg_order_value = int(total_revenue / total_orders) if total_orders > 0 else 0
         
-        vendors = []
-        for idx, row in vendor_stats.iterrows():
-            vendors.append({
-                "rank": len(vendors) + 1,
-                "vendor": str(row['vendor']),
-                "vendor_name": str(row['vendor_name']) if row['vendor_name'] else str(row['vendor']),
-                "invoice_count": int(row['invoice_count']),
-                "total_revenue": int(row['total_revenue']),
-                "total_orders": int(row['total_orders']),
-                "avg_order_value": int(row['avg_order_value'])
-            })
+        vendor_stats.insert(0, 'rank', range(1, len(vendor_stats) + 1))
+        vendor_stats['vendor'] = vendor_stats['vendor'].astype(str)
+        name_str = vendor_stats['vendor_name'].fillna('').astype(str)
+        vendor_stats['vendor_name'] = name_str.where(name_str != '', vendor_stats['vendor'])
+        vendors = _to_json_records(
+            vendor_stats,
+            int_cols=('rank', 'invoice_count', 'total_revenue', 'total_orders', 'avg_order_value')
+        )
         
         return {
             "total_invoices": total_invoices,
@@ -335,9 +446,9 @@ async def get_our_revenue(period: Optional[str] = None):
 
 
 @router.get("/vendor-detail/{vendor_name}")
-async def get_vendor_detail(vendor_name: str, period: Optional[str] = None):
+def get_vendor_detail(vendor_name: str, period: Optional[str] = None):
     """거래처별 상세 분석"""
-    df = get_shipping_data(period)
+    df = get_shipping_data(period, cols_needed={'vendor', 'item', 'qty', 'amount'})
     
     if df.empty:
         return {"error": "데이터 없음"}
@@ -381,58 +492,77 @@ async def get_vendor_detail(vendor_name: str, period: Optional[str] = None):
 
 
 @router.get("/search")
-async def search_data(
+def search_data(
     vendor: Optional[str] = None,
     keyword: Optional[str] = None,
     period: Optional[str] = None,
     limit: int = 100
 ):
-    """상세 검색"""
-    df = get_shipping_data(period)
-    
-    if df.empty:
-        return {"count": 0, "total_qty": 0, "data": []}
-    
-    cols = detect_columns(df)
-    
-    # 거래처 필터
-    if vendor and vendor != "전체" and cols['vendor']:
-        df = df[df[cols['vendor']] == vendor]
-    
-    # 키워드 필터
-    if keyword and cols['item']:
-        df = df[df[cols['item']].str.contains(keyword, case=False, na=False)]
-    
-    if cols['qty']:
-        df[cols['qty']] = pd.to_numeric(df[cols['qty']], errors='coerce').fillna(0)
-    
-    total_qty = int(df[cols['qty']].sum()) if cols['qty'] else 0
-    
-    # 결과 반환
-    display_cols = [c for c in [cols['vendor'], cols['item'], cols['qty'], cols['amount']] if c and c in df.columns]
-    df_result = df[display_cols].head(limit)
-    
+    """상세 검색 (SQL 필터 + LIMIT 푸시다운, 테이블 로드 없음)"""
+    with get_connection() as con:
+        table_cols = _shipping_table_columns(con)
+        vendor_col = next((c for c in COL_CANDIDATES['vendor'] if c in table_cols), None)
+        item_col = next((c for c in COL_CANDIDATES['item'] if c in table_cols), None)
+        qty_col = next((c for c in COL_CANDIDATES['qty'] if c in table_cols), None)
+        amount_col = next((c for c in COL_CANDIDATES['amount'] if c in table_cols), None)
+        date_col = next((c for c in DATE_COL_CANDIDATES if c in table_cols), None)
+
+        display_cols = [c for c in (vendor_col, item_col, qty_col, amount_col) if c]
+        if not display_cols:
+            return {"count": 0, "total_qty": 0, "data": []}
+
+        where = []
+        params = []
+        if period and period != "전체" and date_col:
+            where.append(f"strftime('%Y-%m', [{date_col}]) = ?")
+            params.append(period)
+        if vendor and vendor != "전체" and vendor_col:
+            where.append(f"[{vendor_col}] = ?")
+            params.append(vendor)
+        if keyword and item_col:
+            where.append(f"[{item_col}] LIKE ?")
+            params.append(f"%{keyword}%")
+        where_sql = (" WHERE " + " AND ".join(where)) if where else ""
+
+        # 전체 건수/수량은 동일 조건의 집계 쿼리로 계산
+        qty_agg = f"COALESCE(SUM(CAST([{qty_col}] AS REAL)), 0)" if qty_col else "0"
+        count, total_qty = con.execute(
+            f"SELECT COUNT(*), {qty_agg} FROM shipping_stats{where_sql}", params
+        ).fetchone()
+
+        sel = ", ".join(f"[{c}]" for c in display_cols)
+        rows = con.execute(
+            f"SELECT {sel} FROM shipping_stats{where_sql} LIMIT ?", params + [limit]
+        ).fetchall()
+
     return {
-        "count": len(df),
-        "total_qty": total_qty,
-        "data": df_result.to_dict(orient='records')
+        "count": int(count),
+        "total_qty": int(total_qty or 0),
+        "data": [dict(zip(display_cols, r)) for r in rows]
     }
 
 
 @router.get("/vendors-list")
-async def get_vendors_list(period: Optional[str] = None):
-    """거래처 목록 조회"""
-    df = get_shipping_data(period)
-    
-    if df.empty:
-        return []
-    
-    cols = detect_columns(df)
-    
-    if not cols['vendor']:
-        return []
-    
-    return sorted(df[cols['vendor']].dropna().unique().tolist())
+def get_vendors_list(period: Optional[str] = None):
+    """거래처 목록 조회 (테이블 로드 없이 SQL DISTINCT로 직접 조회)"""
+    with get_connection() as con:
+        table_cols = _shipping_table_columns(con)
+        vendor_col = next((c for c in VENDOR_COL_CANDIDATES if c in table_cols), None)
+        if not vendor_col:
+            return []
+
+        query = f'SELECT DISTINCT [{vendor_col}] FROM shipping_stats WHERE [{vendor_col}] IS NOT NULL'
+        params = []
+
+        date_col = next((c for c in DATE_COL_CANDIDATES if c in table_cols), None)
+        if period and period != "전체" and date_col:
+            query += f" AND strftime('%Y-%m', [{date_col}]) = ?"
+            params.append(period)
+
+        query += f' ORDER BY [{vendor_col}]'
+        rows = con.execute(query, params).fetchall()
+
+    return [r[0] for r in rows]
 
 
 # ─────────────────────────────────────
@@ -440,21 +570,24 @@ async def get_vendors_list(period: Optional[str] = None):
 # ─────────────────────────────────────
 
 @router.get("/invoice-summary")
-async def get_invoice_summary(period: Optional[str] = None):
+def get_invoice_summary(period: Optional[str] = None):
     """인보이스 기반 전체 요약 (보관료, 택배비, 항목별 비용 등)"""
     try:
         with get_connection() as con:
             # 기간 필터
             date_filter = ""
             if period and period != "전체":
-                date_filter = f"WHERE strftime('%Y-%m', i.period_from) = '{period}'"
+                # 별칭 없는 FROM invoices 쿼리에 끼워지므로 컬럼명만 쓴다.
+                # substr(period_from, 1, 7) 형태여야 idx_invoices_period_ym
+                # 표현식 인덱스를 탄다 (strftime은 인덱스 불가).
+                date_filter = f"WHERE substr(period_from, 1, 7) = '{period}'"
             
             # 인보이스 목록
-            df_invoices = pd.read_sql(f"""
+            df_invoices = _read_sql_fast(con, f"""
                 SELECT invoice_id, vendor_id, total_amount, period_from
                 FROM invoices
                 {date_filter}
-            """, con)
+            """)
             
             if df_invoices.empty:
                 return {
@@ -473,22 +606,21 @@ async def get_invoice_summary(period: Optional[str] = None):
             placeholders = ",".join(["?"] * len(invoice_ids))
             
             # 모든 인보이스 항목
-            df_items = pd.read_sql(f"""
+            df_items = _read_sql_fast(con, f"""
                 SELECT ii.invoice_id, ii.item_name, ii.qty, ii.unit_price, ii.amount,
                        i.vendor_id, v.name as vendor_name
                 FROM invoice_items ii
                 JOIN invoices i ON ii.invoice_id = i.invoice_id
                 LEFT JOIN vendors v ON i.vendor_id = v.vendor
                 WHERE ii.invoice_id IN ({placeholders})
-            """, con, params=invoice_ids)
+            """, invoice_ids)
             
             # 사용 가능한 기간 목록
-            periods_df = pd.read_sql("""
-                SELECT DISTINCT strftime('%Y-%m', period_from) as period
+            periods = [r[0] for r in con.execute("""
+                SELECT DISTINCT substr(period_from, 1, 7) as period
                 FROM invoices
                 ORDER BY period DESC
-            """, con)
-            periods = periods_df['period'].tolist()
+            """)]
         
         if df_items.empty:
             return {
@@ -534,39 +666,29 @@ async def get_invoice_summary(period: Optional[str] = None):
         df_items['category'] = df_items['item_name'].apply(categorize_item)
         
         # 카테고리별 집계
-        category_stats = df_items.groupby('category').agg({
-            'amount': 'sum',
-            'qty': 'sum',
-            'item_name': 'count'
-        }).reset_index()
-        category_stats.columns = ['category', 'total_amount', 'total_qty', 'item_count']
+        category_stats = df_items.groupby('category').agg(
+            total_amount=('amount', 'sum'),
+            total_qty=('qty', 'sum'),
+            item_count=('item_name', 'count'),
+        ).reset_index()
         category_stats = category_stats.sort_values('total_amount', ascending=False)
         
-        category_breakdown = []
-        for _, row in category_stats.iterrows():
-            category_breakdown.append({
-                "category": row['category'],
-                "total_amount": int(row['total_amount']),
-                "total_qty": int(row['total_qty']),
-                "item_count": int(row['item_count'])
-            })
+        category_breakdown = _to_json_records(
+            category_stats, int_cols=('total_amount', 'total_qty', 'item_count')
+        )
         
         # 거래처별 집계
-        vendor_stats = df_items.groupby(['vendor_id', 'vendor_name']).agg({
-            'amount': 'sum',
-            'item_name': 'count'
-        }).reset_index()
-        vendor_stats.columns = ['vendor_id', 'vendor_name', 'total_amount', 'item_count']
+        vendor_stats = df_items.groupby(['vendor_id', 'vendor_name']).agg(
+            total_amount=('amount', 'sum'),
+            item_count=('item_name', 'count'),
+        ).reset_index()
         vendor_stats = vendor_stats.sort_values('total_amount', ascending=False)
         
-        vendor_breakdown = []
-        for _, row in vendor_stats.iterrows():
-            vendor_breakdown.append({
-                "vendor": row['vendor_id'],
-                "vendor_name": row['vendor_name'] or row['vendor_id'],
-                "total_amount": int(row['total_amount']),
-                "item_count": int(row['item_count'])
-            })
+        vendor_stats = vendor_stats.rename(columns={'vendor_id': 'vendor'})
+        vendor_stats['vendor_name'] = vendor_stats['vendor_name'].fillna(vendor_stats['vendor'])
+        vendor_breakdown = _to_json_records(
+            vendor_stats, int_cols=('total_amount', 'item_count')
+        )
         
         # 주요 비용 합계
         total_storage = int(df_items[df_items['category'] == '보관료']['amount'].sum())
@@ -602,7 +724,7 @@ async def get_invoice_summary(period: Optional[str] = None):
 
 
 @router.get("/invoice-items-detail")
-async def get_invoice_items_detail(
+def get_invoice_items_detail(
     period: Optional[str] = None,
     category: Optional[str] = None,
     vendor: Optional[str] = None
@@ -628,7 +750,7 @@ async def get_invoice_items_detail(
             params = []
             
             if period and period != "전체":
-                query += " AND strftime('%Y-%m', i.period_from) = ?"
+                query += " AND substr(i.period_from, 1, 7) = ?"
                 params.append(period)
             
             if vendor and vendor != "전체":
@@ -661,19 +783,12 @@ async def get_invoice_items_detail(
             df['category'] = df['item_name'].apply(categorize_item)
             df = df[df['category'] == category]
         
-        result = []
-        for _, row in df.iterrows():
-            result.append({
-                "item_name": row['item_name'],
-                "vendor": row['vendor_id'],
-                "vendor_name": row['vendor_name'] or row['vendor_id'],
-                "total_qty": int(row['total_qty']),
-                "unit_price": int(row['unit_price']),
-                "total_amount": int(row['total_amount']),
-                "invoice_count": int(row['invoice_count'])
-            })
-        
-        return result
+        df = df.rename(columns={'vendor_id': 'vendor'})
+        df['vendor_name'] = df['vendor_name'].fillna(df['vendor'])
+        return _to_json_records(
+            df[['item_name', 'vendor', 'vendor_name', 'total_qty', 'unit_price', 'total_amount', 'invoice_count']],
+            int_cols=('total_qty', 'unit_price', 'total_amount', 'invoice_count')
+        )
     
     except Exception as e:
         return {"error": str(e)}
@@ -2,33 +2,85 @@
 backend/app/api/invoices.py - 인보이스 목록 및 관리 API
 """
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional, Dict, Any
+from functools import lru_cache
 import pandas as pd
+import sqlite3
 import io
+import re
 
-from logic.db import get_connection
+# 엑셀 시트명에 쓸 수 없는 문자 (모듈 로드 시 한 번만 컴파일)
+_SHEETNAME_BAD = re.compile(r'[\\/*?:\[\]]')
+
+# 숫자 셀 표시 형식 — 문자열 대신 숫자 값 + 서식으로 기록 (엑셀에서 합산 가능,
+# 공유 문자열 테이블도 커지지 않는다)
+_NUM_FMT = '#,##0'
+_WON_FMT = '"₩" #,##0'
+
+from logic.db import get_connection, _resolve_db_path
 from backend.app.api.logs import add_log
 
-router = APIRouter(prefix="/invoices", tags=["invoices"])
+# orjson 직렬화 — 표준 json 대비 목록 응답 직렬화가 수 배 빠르다
+router = APIRouter(prefix="/invoices", tags=["invoices"], default_response_class=ORJSONResponse)
 
 
 # ─────────────────────────────────────
 # 권한 체크 헬퍼
 # ─────────────────────────────────────
 
-def check_admin(token: Optional[str]) -> tuple:
-    """관리자 권한 확인, (is_admin, nickname) 반환"""
+# 세션 조회 캐시 (토큰 → (is_admin, nickname), 60초 TTL — 핫 토큰의 반복 JOIN 제거)
+_SESSION_CACHE = {}
+_SESSION_CACHE_TTL = 60.0
+
+
+def resolve_session(con, token: Optional[str]) -> tuple:
+    """토큰으로 (is_admin, nickname) 조회 (캐시됨)
+
+    기존 check_admin / get_user_nickname / get_nickname_from_token이
+    각자 돌리던 sessions↔users JOIN을 한 곳으로 모은다.
+    """
     if not token:
         return False, None
-    with get_connection() as con:
+    import time
+    now = time.monotonic()
+    hit = _SESSION_CACHE.get(token)
+    if hit and now - hit[0] < _SESSION_CACHE_TTL:
+        return hit[1]
+    try:
         result = con.execute(
             "SELECT u.is_admin, u.nickname FROM sessions s JOIN users u ON s.user_id = u.user_id WHERE s.token = ?",
             (token,)
         ).fetchone()
-        if result:
-            return bool(result[0]), result[1]
-    return False, None
+    except sqlite3.OperationalError:
+        # sessions/users 테이블이 아직 없는 경우
+        return False, None
+    value = (bool(result[0]), result[1]) if result else (False, None)
+    if len(_SESSION_CACHE) > 4096:
+        _SESSION_CACHE.clear()
+    _SESSION_CACHE[token] = (now, value)
+    return value
+
+
+def invalidate_session(token: Optional[str] = None) -> None:
+    """세션 삭제 직후 캐시 무효화
+
+    TTL 만료만 기다리면 로그아웃·탈퇴된 토큰이 최대 60초 더 통과하므로
+    세션 행을 지우는 쪽(auth.py)에서 즉시 호출한다. user_id 기준 일괄
+    삭제처럼 토큰을 모르는 경우는 전체를 비운다.
+    """
+    if token is not None:
+        _SESSION_CACHE.pop(token, None)
+    else:
+        _SESSION_CACHE.clear()
+
+
+def check_admin(token: Optional[str]) -> tuple:
+    """관리자 권한 확인, (is_admin, nickname) 반환"""
+    if not token:
+        return False, None
+    with get_connection() as con:
+        return resolve_session(con, token)
 
 
 def get_user_nickname(token: Optional[str]) -> str:
@@ -36,11 +88,318 @@ def get_user_nickname(token: Optional[str]) -> str:
     if not token:
         return '시스템'
     with get_connection() as con:
-        result = con.execute(
-            "SELECT u.nickname FROM sessions s JOIN users u ON s.user_id = u.user_id WHERE s.token = ?",
-            (token,)
-        ).fetchone()
-        return result[0] if result else '시스템'
+        return resolve_session(con, token)[1] or '시스템'
+
+
+def _stream_file(f):
+    """파일류 객체를 64KB 청크 이터레이터로 변환 (소진 후 close)"""
+    f.seek(0)
+
+    def _iter():
+        try:
+            while True:
+                chunk = f.read(65536)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            f.close()
+
+    return _iter()
+
+
+def _stream_workbook(wb):
+    """워크북을 SpooledTemporaryFile로 저장 후 청크 이터레이터 반환
+
+    BytesIO처럼 전체 파일을 메모리에 상주시키지 않고, 5MB를 넘으면
+    디스크로 흘려보낸 뒤 64KB 단위로 응답을 스트리밍한다.
+    """
+    import tempfile
+    f = tempfile.SpooledTemporaryFile(max_size=5 * 1024 * 1024)
+    wb.save(f)
+    return _stream_file(f)
+
+
+def _payment_deadline(period_from) -> str:
+    """지급기한 문자열 — 청구 기간 시작월 + 1개월의 5일
+
+    "2025-11-01"이면 "2025년 12월 05일". strptime/relativedelta 없이
+    연·월 산술만으로 계산한다 (형식이 이상하면 빈 문자열).
+    """
+    try:
+        y, m = int(period_from[:4]), int(period_from[5:7])
+    except (TypeError, ValueError):
+        return ""
+    if not 1 <= m <= 12:
+        return ""
+    y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return f"{y}년 {m:02d}월 05일"
+
+
+@lru_cache(maxsize=2)
+def _korean_date_str(iso_date: str) -> str:
+    """'2025-06-30' -> '2025년 06월 30일 월요일' (형식 오류 시 원문 반환)
+
+    일괄 내보내기에서 시트마다 같은 '오늘' 날짜를 다시 포맷하지 않도록
+    캐시한다.
+    """
+    from datetime import datetime
+    try:
+        dt = datetime.fromisoformat(iso_date)
+    except ValueError:
+        return iso_date
+    weekdays = ('월', '화', '수', '목', '금', '토', '일')
+    return f"{dt.year}년 {dt.month:02d}월 {dt.day:02d}일 {weekdays[dt.weekday()]}요일"
+
+
+def _load_invoice_for_export(invoice_id: int) -> dict:
+    """단일 인보이스 내보내기(PDF/XLSX) 공용 데이터 로더
+
+    인보이스 + 항목 + 회사 설정을 JOIN 한 번으로 읽고, 두 핸들러가
+    똑같이 쓰는 파생 값(건명·수신자·지급기한 등)까지 만들어 반환한다.
+    없는 인보이스면 404를 던진다.
+    """
+    from datetime import datetime
+
+    with get_connection() as con:
+        # 인보이스 컬럼 확인 (모듈 캐시)
+        has_confirmed_by = 'confirmed_by' in _invoice_columns(con)
+
+        confirmed_col = "i.confirmed_by," if has_confirmed_by else "NULL as confirmed_by,"
+
+        # 인보이스 + 항목 + 회사 설정을 JOIN 한 번으로 조회 (왕복 3회 → 1회)
+        con.row_factory = sqlite3.Row
+        rows = con.execute(
+            f"""
+            SELECT
+                i.invoice_id,
+                i.vendor_id,
+                COALESCE(v.name, v.vendor) as vendor_name,
+                i.period_from,
+                i.period_to,
+                i.total_amount,
+                i.created_at,
+                {confirmed_col}
+                it.item_name as 항목, it.qty as 수량, it.unit_price as 단가,
+                it.amount as 금액, it.remark as 비고,
+                cs.company_name, cs.business_number, cs.address,
+                cs.business_type, cs.business_item, cs.bank_name,
+                cs.account_holder, cs.account_number, cs.representative
+            FROM invoices i
+            LEFT JOIN vendors v ON i.vendor_id = v.vendor_id
+            LEFT JOIN invoice_items it ON it.invoice_id = i.invoice_id
+            LEFT JOIN company_settings cs ON cs.id = 1
+            WHERE i.invoice_id = ?
+            ORDER BY it.rowid
+            """,
+            (invoice_id,)
+        ).fetchall()
+
+        if not rows:
+            raise HTTPException(status_code=404, detail="Invoice not found")
+
+        inv = rows[0]
+        vendor_name = str(inv['vendor_name']) if inv['vendor_name'] else 'Unknown'
+        period_from = str(inv['period_from']) if inv['period_from'] else ''
+        period_to = str(inv['period_to']) if inv['period_to'] else ''
+
+        # 담당자 = 인보이스 확정자 닉네임
+        confirmed_by = str(inv['confirmed_by']) if inv['confirmed_by'] is not None else ""
+
+        items = [
+            {'항목': r['항목'], '수량': r['수량'], '단가': r['단가'],
+             '금액': r['금액'], '비고': r['비고']}
+            for r in rows if r['항목'] is not None
+        ]
+
+        # 회사 설정 (JOIN으로 같이 가져온 스칼라 — 첫 행에서 추출, 없으면 빈 값)
+        has_company = inv['company_name'] is not None
+        company = {
+            'company_name': (inv['company_name'] or "") if has_company else "",
+            'business_number': (inv['business_number'] or "") if has_company else "",
+            'address': (inv['address'] or "") if has_company else "",
+            'business_type': (inv['business_type'] or "") if has_company else "",
+            'business_item': (inv['business_item'] or "") if has_company else "",
+            'bank_name': (inv['bank_name'] or "") if has_company else "",
+            'account_holder': (inv['account_holder'] or "") if has_company else "",
+            'account_number': (inv['account_number'] or "") if has_company else "",
+            'representative': (inv['representative'] or "") if has_company else "",
+        }
+
+    # 청구일자
+    invoice_date = datetime.now().strftime("%Y-%m-%d")
+
+    # 건명 생성
+    period_str = period_from[:7].replace("-", "년 ") + "월" if period_from else ""
+
+    return {
+        'vendor_name': vendor_name,
+        'period_from': period_from,
+        'period_to': period_to,
+        'confirmed_by': confirmed_by,
+        'items': items,
+        'company': company,
+        'invoice_date': invoice_date,
+        'doc_number': f"{invoice_id:05d}-{invoice_date.replace('-', '')[:6]}",
+        'title': f"{period_str} 풀필먼트 서비스 대금",
+        'recipient_name': f"{vendor_name} 대표님 귀하",
+        # 지급기한 - 청구 기간 시작월 + 1개월의 5일
+        'payment_deadline': _payment_deadline(period_from),
+    }
+
+
+@lru_cache(maxsize=1)
+def _xlsx_styles():
+    """엑셀 양식 공용 스타일 묶음 (불변 객체 — 프로세스 내 1회만 생성)"""
+    from types import SimpleNamespace
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    return SimpleNamespace(
+        title_font=Font(name='맑은 고딕', size=18, bold=True),
+        header_font=Font(name='맑은 고딕', size=10, bold=True),
+        body_font=Font(name='맑은 고딕', size=9),
+        small_font=Font(name='맑은 고딕', size=8),
+        total_font=Font(name='맑은 고딕', size=11, bold=True),
+        thin_border=Border(
+            left=Side(style='thin'), right=Side(style='thin'),
+            top=Side(style='thin'), bottom=Side(style='thin')
+        ),
+        gray_fill=PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid"),
+        light_gray_fill=PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid"),
+        center_align=Alignment(horizontal='center', vertical='center'),
+        left_align=Alignment(horizontal='left', vertical='center'),
+        right_align=Alignment(horizontal='right', vertical='center'),
+    )
+
+
+@lru_cache(maxsize=1)
+def _company_settings():
+    """company_settings 1행 캐시 — 설정 저장 시 cache_clear()로 무효화"""
+    with get_connection() as con:
+        return con.execute("""
+            SELECT company_name, business_number, address, business_type, business_item,
+                   bank_name, account_holder, account_number, representative
+            FROM company_settings WHERE id = 1
+        """).fetchone()
+
+
+# 인보이스 기간 목록 캐시 (MAX(invoice_id)+행 수 센티널이 바뀌면 갱신)
+_PERIODS_CACHE = {"key": None, "data": []}
+
+
+def _invoice_periods(con) -> list:
+    """invoices의 년월(DISTINCT) 목록 조회 (캐시됨)
+
+    substr(period_from,1,7)은 strftime보다 싸고 period_from 인덱스를 활용한다.
+    생성/삭제로 센티널이 바뀌면 다음 호출에서 자동 갱신된다.
+    """
+    key = con.execute("SELECT MAX(invoice_id), COUNT(*) FROM invoices").fetchone()
+    if key != _PERIODS_CACHE["key"]:
+        _PERIODS_CACHE["data"] = [r[0] for r in con.execute(
+            "SELECT DISTINCT substr(period_from, 1, 7) AS ym FROM invoices"
+            " WHERE ym IS NOT NULL ORDER BY ym DESC"
+        )]
+        _PERIODS_CACHE["key"] = key
+    return _PERIODS_CACHE["data"]
+
+
+# 런타임에 스키마는 사실상 고정 — PRAGMA table_info를 요청마다 돌리지 않는다
+_INVOICE_COLS: Optional[frozenset] = None
+_INVOICES_TABLE_PRESENT = False
+
+
+def _invoices_table_present(con) -> bool:
+    """invoices 테이블 존재 확인 (한 번 True가 되면 재조회 없음)"""
+    global _INVOICES_TABLE_PRESENT
+    if not _INVOICES_TABLE_PRESENT:
+        _INVOICES_TABLE_PRESENT = con.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='invoices' LIMIT 1"
+        ).fetchone() is not None
+    return _INVOICES_TABLE_PRESENT
+
+
+def _invoice_columns(con) -> frozenset:
+    """invoices 테이블 컬럼 집합 (프로세스 내 1회 조회 후 캐시)"""
+    global _INVOICE_COLS
+    if _INVOICE_COLS is None:
+        _INVOICE_COLS = frozenset(
+            c[1] for c in con.execute("PRAGMA table_info(invoices);")
+        )
+    return _INVOICE_COLS
+
+
+# 목록 응답 캐시 (필터 인자 키 + 5초 TTL, 변경 시 버전 증가로 즉시 무효화)
+_LIST_CACHE = {}
+_LIST_CACHE_TTL = 5.0
+_INVOICES_VERSION = 0
+
+
+def _bump_invoices_version():
+    """인보이스 변경(삭제/확정/수정) 시 호출 — 목록 캐시 무효화"""
+    global _INVOICES_VERSION
+    _INVOICES_VERSION += 1
+    _LIST_CACHE.clear()
+
+
+@lru_cache(maxsize=64)
+def _build_list_sql(
+    has_period: bool,
+    has_vendor: bool,
+    has_status: bool,
+    has_vendor_cached: bool,
+    has_modified: bool,
+    has_confirmed: bool,
+    has_page: bool = False
+) -> tuple:
+    """목록/합계 SQL 조립 (필터 형태는 몇 가지뿐이라 조립 결과를 캐시)
+
+    같은 문자열이 재사용되므로 SQLite의 문장 캐시(cached_statements)에도
+    그대로 적중한다. (목록 쿼리, 집계 쿼리) 튜플 반환.
+    """
+    # 비정규화된 vendor_name_cached가 있으면 vendors 조인 자체를 생략
+    # (거래처 필터는 미리 해석한 vendor_id로 걸리므로 조인이 필요 없음)
+    if not has_vendor_cached:
+        join = "\n                LEFT JOIN vendors v ON i.vendor_id = v.vendor_id"
+        vendor_name_expr = "COALESCE(v.name, v.vendor, i.vendor_id)"
+    else:
+        join = ""
+        vendor_name_expr = "COALESCE(i.vendor_name_cached, i.vendor_id)"
+
+    select_cols = f"""
+                    i.invoice_id,
+                    i.vendor_id,
+                    {vendor_name_expr} as vendor_name,
+                    i.period_from,
+                    i.period_to,
+                    i.total_amount,
+                    COALESCE(i.status, '미확정') as status,
+                    i.created_at"""
+    if has_modified:
+        select_cols += ", i.modified_by, i.modified_at"
+    if has_confirmed:
+        select_cols += ", i.confirmed_by, i.confirmed_at"
+
+    filters = ""
+    if has_period:
+        filters += " AND substr(i.period_from, 1, 7) = ?"
+    if has_vendor:
+        # 이름 OR 비교 대신 vendor_id 등가 비교 — idx_invoices_vendor를 탄다
+        filters += " AND i.vendor_id = ?"
+    if has_status:
+        filters += " AND i.status = ?"
+
+    limit_clause = "\n                LIMIT ? OFFSET ?" if has_page else ""
+    query = f"""
+                SELECT {select_cols}
+                FROM invoices i{join}
+                WHERE 1=1{filters}
+                ORDER BY i.invoice_id DESC{limit_clause}
+            """
+    agg_query = f"""
+                SELECT COUNT(*), COALESCE(SUM(i.total_amount), 0)
+                FROM invoices i{join}
+                WHERE 1=1{filters}
+                """
+    return query, agg_query
 
 
 # ─────────────────────────────────────
@@ -49,290 +408,231 @@ def get_user_nickname(token: Optional[str]) -> str:
 
 @router.get("")
 @router.get("/")
-async def list_invoices(
+def list_invoices(
     period: Optional[str] = None,
     vendor: Optional[str] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    page: Optional[int] = None,
+    page_size: int = 100
 ):
-    """인보이스 목록 조회"""
+    """인보이스 목록 조회 (page를 주면 LIMIT/OFFSET 페이지네이션)"""
+    import time
+    cache_key = (period, vendor, status, page, page_size, _INVOICES_VERSION)
+    cached = _LIST_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+        return cached[1]
+
     try:
         with get_connection() as con:
-            # 테이블 존재 확인
-            tables = [row[0] for row in con.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()]
-            
-            if "invoices" not in tables:
+            # 테이블 존재 확인 (캐시 — 한 번 확인되면 sqlite_master 조회 생략)
+            if not _invoices_table_present(con):
                 return {"invoices": [], "total": 0, "sum_amount": 0}
             
-            # 필수 컬럼 존재 확인 및 추가
-            ensure_invoice_user_columns(con)
-            
-            # 컬럼 존재 확인
-            cols = [c[1] for c in con.execute("PRAGMA table_info(invoices);")]
+            # 컬럼 존재 확인 (마이그레이션은 ensure_tables가 기동 시 수행)
+            cols = _invoice_columns(con)
             has_modified_by = 'modified_by' in cols and 'modified_at' in cols
             has_confirmed_by = 'confirmed_by' in cols and 'confirmed_at' in cols
-            
-            # 기본 쿼리
-            select_cols = """
-                    i.invoice_id,
-                    i.vendor_id,
-                    COALESCE(v.name, v.vendor, i.vendor_id) as vendor_name,
-                    i.period_from,
-                    i.period_to,
-                    i.total_amount,
-                    COALESCE(i.status, '미확정') as status,
-                    i.created_at"""
-            
-            if has_modified_by:
-                select_cols += ", i.modified_by, i.modified_at"
-            if has_confirmed_by:
-                select_cols += ", i.confirmed_by, i.confirmed_at"
-            
-            query = f"""
-                SELECT {select_cols}
-                FROM invoices i
-                LEFT JOIN vendors v ON i.vendor_id = v.vendor_id
-                WHERE 1=1
-            """
+
+            # 거래처 이름은 먼저 vendor_id로 해석 — 본 쿼리는 OR 두 컬럼 비교
+            # 대신 인덱스를 타는 등가 비교만 수행 (미등록 이름이면 매치 없음)
+            vendor_id = None
+            if vendor:
+                row = con.execute(
+                    "SELECT vendor_id FROM vendors WHERE name = ? OR vendor = ? LIMIT 1",
+                    (vendor, vendor)
+                ).fetchone()
+                vendor_id = row[0] if row else -1
+
+            # 필터 형태별로 미리 조립된 SQL 사용
+            query, agg_query = _build_list_sql(
+                bool(period), bool(vendor), bool(status),
+                'vendor_name_cached' in cols, has_modified_by, has_confirmed_by,
+                page is not None
+            )
+
             params = []
-            
-            # 필터 적용
             if period:
-                query += " AND strftime('%Y-%m', i.period_from) = ?"
                 params.append(period)
-            
             if vendor:
-                query += " AND (v.vendor = ? OR v.name = ?)"
-                params.extend([vendor, vendor])
-            
+                params.append(vendor_id)
             if status:
-                query += " AND i.status = ?"
                 params.append(status)
-            
-            query += " ORDER BY i.invoice_id DESC"
-            
-            df = pd.read_sql(query, con, params=params)
-            
-            # 합계 계산
-            df['total_amount'] = pd.to_numeric(df['total_amount'], errors='coerce').fillna(0)
-            sum_amount = int(df['total_amount'].sum())
-            
-            invoices = []
-            for _, row in df.iterrows():
-                inv_data = {
-                    "invoice_id": int(row['invoice_id']),
-                    "vendor_id": row['vendor_id'],
-                    "vendor": str(row['vendor_name']) if row['vendor_name'] else '',
-                    "period_from": str(row['period_from']) if row['period_from'] else '',
-                    "period_to": str(row['period_to']) if row['period_to'] else '',
-                    "total_amount": int(row['total_amount']),
-                    "status": str(row['status']),
-                    "created_at": str(row['created_at']) if row['created_at'] else '',
-                    "modified_by": str(row['modified_by']) if has_modified_by and pd.notna(row.get('modified_by')) else None,
-                    "modified_at": str(row['modified_at']) if has_modified_by and pd.notna(row.get('modified_at')) else None,
-                    "confirmed_by": str(row['confirmed_by']) if has_confirmed_by and pd.notna(row.get('confirmed_by')) else None,
-                    "confirmed_at": str(row['confirmed_at']) if has_confirmed_by and pd.notna(row.get('confirmed_at')) else None,
-                }
-                invoices.append(inv_data)
-            
-            # 사용 가능한 기간 목록
-            periods_df = pd.read_sql(
-                "SELECT DISTINCT strftime('%Y-%m', period_from) as ym FROM invoices ORDER BY ym DESC",
-                con
-            )
-            periods = periods_df['ym'].dropna().tolist()
-            
-            return {
+
+            # 건수/합계는 SQL 집계로 계산 (컬럼 전체를 파이썬으로 끌어오지 않음)
+            total_count, sum_amount = con.execute(agg_query, params).fetchone()
+            sum_amount = int(sum_amount)
+
+            if page is not None:
+                page = max(page, 1)
+                page_size = max(page_size, 1)
+                params = params + [page_size, (page - 1) * page_size]
+
+            # 최종 출력이 dict 리스트라 DataFrame 중간 단계 없이 커서에서 바로 생성
+            con.row_factory = sqlite3.Row
+            rows = con.execute(query, params).fetchall()
+
+            # sqlite3.Row 값은 이미 파이썬 기본형 — 행마다 캐스팅하지 않는다
+            # (vendor_name만 COALESCE 폴백이 정수일 수 있어 str 유지)
+            invoices = [{
+                "invoice_id": r['invoice_id'],
+                "vendor_id": r['vendor_id'],
+                "vendor": str(r['vendor_name']) if r['vendor_name'] is not None else '',
+                "period_from": r['period_from'] or '',
+                "period_to": r['period_to'] or '',
+                "total_amount": int(r['total_amount'] or 0),
+                "status": r['status'],
+                "created_at": r['created_at'] or '',
+                "modified_by": r['modified_by'] if has_modified_by else None,
+                "modified_at": r['modified_at'] if has_modified_by else None,
+                "confirmed_by": r['confirmed_by'] if has_confirmed_by else None,
+                "confirmed_at": r['confirmed_at'] if has_confirmed_by else None,
+            } for r in rows]
+            
+            # 사용 가능한 기간 목록 (캐시)
+            periods = _invoice_periods(con)
+
+            result = {
                 "invoices": invoices,
-                "total": len(invoices),
+                "total": int(total_count),
                 "sum_amount": sum_amount,
                 "periods": periods
             }
+            if page is not None:
+                result["page"] = page
+                result["page_size"] = page_size
+            if len(_LIST_CACHE) > 128:
+                _LIST_CACHE.clear()
+            _LIST_CACHE[cache_key] = (time.monotonic(), result)
+            return result
     
-    except Exception as e:
+    except sqlite3.Error as e:
+        # DB 오류만 기존 응답 형태로 감싼다 (프런트가 data.error를 표시).
+        # 코드 버그는 숨기지 않고 FastAPI 예외 처리로 그대로 올린다.
         return {"invoices": [], "total": 0, "sum_amount": 0, "error": str(e)}
 
 
+@router.get("/stream")
+def stream_invoices(
+    period: Optional[str] = None,
+    vendor: Optional[str] = None,
+    status: Optional[str] = None
+):
+    """인보이스 목록 NDJSON 스트리밍 (대량 조회용)
+
+    첫 줄은 {"total", "sum_amount"} 메타, 이후 인보이스 1건당 한 줄.
+    전체 목록을 메모리에 직렬화하지 않아 건수와 무관하게 바로 응답이 시작된다.
+    """
+    import json
+
+    where = " WHERE 1=1"
+    params = []
+    if period:
+        where += " AND substr(i.period_from, 1, 7) = ?"
+        params.append(period)
+    if vendor:
+        where += " AND (v.vendor = ? OR v.name = ?)"
+        params.extend([vendor, vendor])
+    if status:
+        where += " AND i.status = ?"
+        params.append(status)
+
+    base = "FROM invoices i LEFT JOIN vendors v ON i.vendor_id = v.vendor_id" + where
+
+    def generate():
+        # 스트리밍 제너레이터는 Starlette 스레드풀에서 next() 때마다 다른
+        # 워커 스레드를 탈 수 있어, 스레드 고정인 get_connection() 핸들을
+        # 쓰면 ProgrammingError가 난다 — 응답 동안만 쓰는 전용 커넥션 사용.
+        con = sqlite3.connect(_resolve_db_path(), check_same_thread=False)
+        try:
+            con.row_factory = sqlite3.Row
+
+            total, sum_amount = con.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(i.total_amount), 0) {base}", params
+            ).fetchone()
+            yield json.dumps(
+                {"total": total, "sum_amount": int(sum_amount)}, ensure_ascii=False
+            ).encode() + b"\n"
+
+            cur = con.execute(f"""
+                SELECT i.invoice_id, i.vendor_id,
+                       COALESCE(v.name, v.vendor, i.vendor_id) AS vendor,
+                       i.period_from, i.period_to,
+                       CAST(COALESCE(i.total_amount, 0) AS INTEGER) AS total_amount,
+                       COALESCE(i.status, '미확정') AS status,
+                       i.created_at
+                {base} ORDER BY i.invoice_id DESC
+            """, params)
+            while True:
+                rows = cur.fetchmany(1000)
+                if not rows:
+                    break
+                for r in rows:
+                    yield json.dumps(dict(r), ensure_ascii=False).encode() + b"\n"
+        finally:
+            con.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get("/periods")
+def get_invoice_periods():
+    """인보이스 년월 목록 (UI 드롭다운 초기화용 — 목록 조회와 분리)"""
+    try:
+        with get_connection() as con:
+            return {"periods": _invoice_periods(con)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{invoice_id}/export/pdf")
-async def export_single_invoice_pdf(invoice_id: int):
+def export_single_invoice_pdf(invoice_id: int):
     """단일 인보이스 PDF 다운로드 (물류대행 서비스 대금청구서 양식)"""
     try:
         from logic.invoice_pdf_v2 import create_billing_invoice_pdf
-        from datetime import datetime
-        
-        with get_connection() as con:
-            # 인보이스 컬럼 확인 및 마이그레이션
-            cols = [c[1] for c in con.execute("PRAGMA table_info(invoices);")]
-            if 'confirmed_by' not in cols:
-                try:
-                    con.execute("ALTER TABLE invoices ADD COLUMN confirmed_by TEXT")
-                    con.commit()
-                except:
-                    pass
-            has_confirmed_by = True  # 컬럼이 있거나 추가됨
-            
-            # 인보이스 정보 (확정자 닉네임 포함)
-            select_cols = """
-                i.invoice_id,
-                i.vendor_id,
-                COALESCE(v.name, v.vendor) as vendor_name,
-                i.period_from,
-                i.period_to,
-                i.total_amount,
-                i.created_at
-            """
-            if has_confirmed_by:
-                select_cols += ", i.confirmed_by"
-            
-            inv_df = pd.read_sql(
-                f"""
-                SELECT {select_cols}
-                FROM invoices i
-                LEFT JOIN vendors v ON i.vendor_id = v.vendor_id
-                WHERE i.invoice_id = ?
-                """,
-                con, params=[invoice_id]
-            )
-            
-            if inv_df.empty:
-                raise HTTPException(status_code=404, detail="Invoice not found")
-            
-            inv = inv_df.iloc[0]
-            vendor_name = str(inv['vendor_name']) if inv['vendor_name'] else 'Unknown'
-            period_from = str(inv['period_from']) if inv['period_from'] else ''
-            period_to = str(inv['period_to']) if inv['period_to'] else ''
-            
-            # 담당자 = 인보이스 확정자 닉네임
-            confirmed_by = ""
-            if has_confirmed_by and pd.notna(inv.get('confirmed_by')):
-                confirmed_by = str(inv['confirmed_by'])
-            
-            # 항목 조회
-            items_df = pd.read_sql(
-                "SELECT item_name as 항목, qty as 수량, unit_price as 단가, amount as 금액, remark as 비고 FROM invoice_items WHERE invoice_id = ?",
-                con, params=[invoice_id]
-            )
-            
-            items = items_df.to_dict('records')
-        
-        # 청구일자
-        invoice_date = datetime.now().strftime("%Y-%m-%d")
-        
-        # 건명 생성
-        period_str = period_from[:7].replace("-", "년 ") + "월" if period_from else ""
-        title = f"{period_str} 풀필먼트 서비스 대금"
-        
-        # 수신자 - "업체별칭 대표님 귀하"
-        recipient_name = f"{vendor_name} 대표님 귀하"
-        
-        # 회사 설정 조회 (DB에서) - 테이블 및 기본값 보장
-        with get_connection() as con2:
-            # 테이블 존재 확인 및 생성
-            table_exists = con2.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='company_settings'"
-            ).fetchone()
-            
-            if not table_exists:
-                con2.execute("""
-                    CREATE TABLE company_settings(
-                        id              INTEGER PRIMARY KEY CHECK (id = 1),
-                        company_name    TEXT DEFAULT '회사명',
-                        business_number TEXT DEFAULT '000-00-00000',
-                        address         TEXT DEFAULT '주소를 입력하세요',
-                        business_type   TEXT DEFAULT '서비스',
-                        business_item   TEXT DEFAULT '물류대행',
-                        bank_name       TEXT DEFAULT '은행명',
-                        account_holder  TEXT DEFAULT '예금주',
-                        account_number  TEXT DEFAULT '계좌번호',
-                        representative  TEXT DEFAULT '대표자명',
-                        updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                con2.commit()
-            
-            # 기본 레코드 삽입 (없으면)
-            row_check = con2.execute("SELECT 1 FROM company_settings WHERE id = 1").fetchone()
-            if not row_check:
-                con2.execute("""
-                    INSERT INTO company_settings (id, company_name, business_number, address, 
-                        business_type, business_item, bank_name, account_holder, account_number, representative)
-                    VALUES (1, '틸리언', '766-55-00323', '대구시 동구 첨단로8길 8 씨제이빌딩302호',
-                        '서비스', '포장 및 충전업', '카카오뱅크', '장지훈', '3333-02-9946468', '장지훈')
-                """)
-                con2.commit()
-            
-            company_row = con2.execute("""
-                SELECT company_name, business_number, address, business_type, business_item,
-                       bank_name, account_holder, account_number, representative
-                FROM company_settings WHERE id = 1
-            """).fetchone()
-        
-        if company_row:
-            supplier_info = {
-                "사업자번호": company_row[1] or "",
-                "상호": company_row[0] or "",
-                "소재지": company_row[2] or "",
-                "업태": company_row[3] or "",
-                "종목": company_row[4] or "",
-            }
-            bank_info = {
-                "은행명": company_row[5] or "",
-                "예금주": company_row[6] or "",
-                "계좌번호": company_row[7] or "",
-            }
-            representative = company_row[8] or ""
-            company_display_name = company_row[0] or ""
-        else:
-            # 기본값 (설정이 없는 경우)
-            supplier_info = {
-                "사업자번호": "",
-                "상호": "",
-                "소재지": "",
-                "업태": "",
-                "종목": "",
-            }
-            bank_info = {
-                "은행명": "",
-                "예금주": "",
-                "계좌번호": "",
-            }
-            representative = ""
-            company_display_name = ""
-        
-        # 지급기한 - 청구 기간 시작월 + 1개월의 5일
-        # period_from이 "2025-11-01"이면 -> "2025년 12월 05일"
-        if period_from:
-            try:
-                from dateutil.relativedelta import relativedelta
-                period_dt = datetime.strptime(period_from[:10], "%Y-%m-%d")
-                next_month = period_dt + relativedelta(months=1)
-                payment_deadline = f"{next_month.year}년 {next_month.month:02d}월 05일"
-            except:
-                payment_deadline = ""
-        else:
-            payment_deadline = ""
-        
-        # PDF 생성
-        pdf_bytes = create_billing_invoice_pdf(
+
+        # 데이터 로딩은 XLSX 핸들러와 공용 (JOIN 1회 + 파생 값 계산)
+        ctx = _load_invoice_for_export(invoice_id)
+        company = ctx['company']
+        period_from = ctx['period_from']
+        confirmed_by = ctx['confirmed_by']
+
+        supplier_info = {
+            "사업자번호": company['business_number'],
+            "상호": company['company_name'],
+            "소재지": company['address'],
+            "업태": company['business_type'],
+            "종목": company['business_item'],
+        }
+        bank_info = {
+            "은행명": company['bank_name'],
+            "예금주": company['account_holder'],
+            "계좌번호": company['account_number'],
+        }
+        representative = company['representative']
+
+        # PDF 생성 — bytes 사본 없이 스풀 파일에 직접 기록 후 청크 스트리밍
+        import tempfile
+        pdf_buf = tempfile.SpooledTemporaryFile(max_size=5 * 1024 * 1024)
+        create_billing_invoice_pdf(
             invoice_id=invoice_id,
-            invoice_date=invoice_date,
-            recipient_name=recipient_name,
-            title=title,
+            invoice_date=ctx['invoice_date'],
+            recipient_name=ctx['recipient_name'],
+            title=ctx['title'],
             supplier_info=supplier_info,
-            items=items,
-            payment_deadline=payment_deadline,
+            items=ctx['items'],
+            payment_deadline=ctx['payment_deadline'],
             bank_info=bank_info,
             stamp_holder=representative,  # 대표 - DB에서 가져옴
             manager=confirmed_by if confirmed_by else representative,  # 담당 - 확정자 없으면 대표자
-            company_name=company_display_name,  # 하단 회사명 - DB에서 가져옴
+            company_name=company['company_name'],  # 하단 회사명 - DB에서 가져옴
+            sink=pdf_buf,
         )
-        
+
         # 파일명 생성
         filename = f"invoice_{invoice_id}_{period_from[:7] if period_from else 'unknown'}.pdf"
-        
+
         return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+            _stream_file(pdf_buf),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
@@ -346,232 +646,146 @@ async def export_single_invoice_pdf(invoice_id: int):
 
 
 @router.get("/{invoice_id}/export/xlsx")
-async def export_single_invoice_xlsx(invoice_id: int):
+def export_single_invoice_xlsx(invoice_id: int):
     """단일 인보이스 엑셀 다운로드 (PDF와 동일한 양식)"""
     try:
         from datetime import datetime
         from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-        from openpyxl.utils import get_column_letter
-        import re
-        
-        with get_connection() as con:
-            # 인보이스 컬럼 확인
-            cols = [c[1] for c in con.execute("PRAGMA table_info(invoices);")]
-            has_confirmed_by = 'confirmed_by' in cols
-            
-            # 인보이스 정보
-            select_cols = """
-                i.invoice_id,
-                i.vendor_id,
-                COALESCE(v.name, v.vendor) as vendor_name,
-                i.period_from,
-                i.period_to,
-                i.total_amount,
-                i.created_at
-            """
-            if has_confirmed_by:
-                select_cols += ", i.confirmed_by"
-            
-            inv_df = pd.read_sql(
-                f"""
-                SELECT {select_cols}
-                FROM invoices i
-                LEFT JOIN vendors v ON i.vendor_id = v.vendor_id
-                WHERE i.invoice_id = ?
-                """,
-                con, params=[invoice_id]
-            )
-            
-            if inv_df.empty:
-                raise HTTPException(status_code=404, detail="Invoice not found")
-            
-            inv = inv_df.iloc[0]
-            vendor_name = str(inv['vendor_name']) if inv['vendor_name'] else 'Unknown'
-            period_from = str(inv['period_from']) if inv['period_from'] else ''
-            period_to = str(inv['period_to']) if inv['period_to'] else ''
-            
-            # 담당자 = 인보이스 확정자 닉네임
-            confirmed_by = ""
-            if has_confirmed_by and pd.notna(inv.get('confirmed_by')):
-                confirmed_by = str(inv['confirmed_by'])
-            
-            # 항목 조회
-            items_df = pd.read_sql(
-                "SELECT item_name as 항목, qty as 수량, unit_price as 단가, amount as 금액, remark as 비고 FROM invoice_items WHERE invoice_id = ?",
-                con, params=[invoice_id]
-            )
-            
-            # 회사 설정 조회
-            company_row = con.execute("""
-                SELECT company_name, business_number, address, business_type, business_item,
-                       bank_name, account_holder, account_number, representative
-                FROM company_settings WHERE id = 1
-            """).fetchone()
-        
-        # 회사 정보 설정
-        if company_row:
-            company_name = company_row[0] or ""
-            business_number = company_row[1] or ""
-            address = company_row[2] or ""
-            business_type = company_row[3] or ""
-            business_item = company_row[4] or ""
-            bank_name = company_row[5] or ""
-            account_holder = company_row[6] or ""
-            account_number = company_row[7] or ""
-            representative = company_row[8] or ""
-        else:
-            company_name = business_number = address = business_type = business_item = ""
-            bank_name = account_holder = account_number = representative = ""
-        
-        # 청구일자
-        invoice_date = datetime.now().strftime("%Y-%m-%d")
-        
-        # 건명 생성
-        period_str = period_from[:7].replace("-", "년 ") + "월" if period_from else ""
-        title = f"{period_str} 풀필먼트 서비스 대금"
-        
-        # 수신자
-        recipient_name = f"{vendor_name} 대표님 귀하"
-        
-        # 문서번호
-        doc_number = f"{invoice_id:05d}-{invoice_date.replace('-', '')[:6]}"
-        
-        # 지급기한
-        if period_from:
-            try:
-                from dateutil.relativedelta import relativedelta
-                period_dt = datetime.strptime(period_from[:10], "%Y-%m-%d")
-                next_month = period_dt + relativedelta(months=1)
-                payment_deadline = f"{next_month.year}년 {next_month.month:02d}월 05일"
-            except:
-                payment_deadline = ""
-        else:
-            payment_deadline = ""
-        
+
+        # 데이터 로딩은 PDF 핸들러와 공용 (JOIN 1회 + 파생 값 계산)
+        ctx = _load_invoice_for_export(invoice_id)
+        vendor_name = ctx['vendor_name']
+        period_from = ctx['period_from']
+        confirmed_by = ctx['confirmed_by']
+        items = ctx['items']
+        invoice_date = ctx['invoice_date']
+        title = ctx['title']
+        recipient_name = ctx['recipient_name']
+        doc_number = ctx['doc_number']
+        payment_deadline = ctx['payment_deadline']
+
+        company = ctx['company']
+        company_name = company['company_name']
+        business_number = company['business_number']
+        address = company['address']
+        business_type = company['business_type']
+        business_item = company['business_item']
+        bank_name = company['bank_name']
+        account_holder = company['account_holder']
+        account_number = company['account_number']
+        representative = company['representative']
+
         # 엑셀 워크북 생성
         wb = Workbook()
         ws = wb.active
         ws.title = "청구서"
         
-        # 스타일 정의
-        title_font = Font(name='맑은 고딕', size=18, bold=True)
-        header_font = Font(name='맑은 고딕', size=10, bold=True)
-        body_font = Font(name='맑은 고딕', size=9)
-        small_font = Font(name='맑은 고딕', size=8)
-        
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        gray_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-        light_gray_fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
-        
-        center_align = Alignment(horizontal='center', vertical='center')
-        left_align = Alignment(horizontal='left', vertical='center')
-        right_align = Alignment(horizontal='right', vertical='center')
-        
+        # 스타일 정의 (모듈 캐시 — 요청마다 재생성하지 않음)
+        S = _xlsx_styles()
+        title_font, header_font = S.title_font, S.header_font
+        body_font, small_font = S.body_font, S.small_font
+        thin_border = S.thin_border
+        gray_fill, light_gray_fill = S.gray_fill, S.light_gray_fill
+        center_align, left_align, right_align = S.center_align, S.left_align, S.right_align
+
         current_row = 1
         
         # 1. 제목
-        ws.merge_cells(f'A{current_row}:F{current_row}')
-        ws[f'A{current_row}'] = "물류대행 서비스 대금청구서"
-        ws[f'A{current_row}'].font = title_font
-        ws[f'A{current_row}'].alignment = center_align
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=1, value="물류대행 서비스 대금청구서")
+        c.font = title_font
+        c.alignment = center_align
         current_row += 2
         
         # 2. 문서번호/청구일자
-        ws[f'A{current_row}'] = "문서번호"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws.merge_cells(f'B{current_row}:C{current_row}')
-        ws[f'B{current_row}'] = doc_number
-        ws[f'B{current_row}'].font = body_font
-        ws[f'B{current_row}'].border = thin_border
-        ws[f'D{current_row}'] = "청구일자"
-        ws[f'D{current_row}'].font = header_font
-        ws[f'D{current_row}'].fill = gray_fill
-        ws[f'D{current_row}'].border = thin_border
-        ws.merge_cells(f'E{current_row}:F{current_row}')
-        ws[f'E{current_row}'] = invoice_date
-        ws[f'E{current_row}'].font = body_font
-        ws[f'E{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=1, value="문서번호")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=3)
+        c = ws.cell(row=current_row, column=2, value=doc_number)
+        c.font = body_font
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=4, value="청구일자")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=5, value=invoice_date)
+        c.font = body_font
+        c.border = thin_border
         current_row += 1
         
         # 3. 수신/건명
-        ws[f'A{current_row}'] = "수신"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws.merge_cells(f'B{current_row}:F{current_row}')
-        ws[f'B{current_row}'] = recipient_name
-        ws[f'B{current_row}'].font = body_font
-        ws[f'B{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=1, value="수신")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=2, value=recipient_name)
+        c.font = body_font
+        c.border = thin_border
         current_row += 1
         
-        ws[f'A{current_row}'] = "건명"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws.merge_cells(f'B{current_row}:F{current_row}')
-        ws[f'B{current_row}'] = title
-        ws[f'B{current_row}'].font = body_font
-        ws[f'B{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=1, value="건명")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=2, value=title)
+        c.font = body_font
+        c.border = thin_border
         current_row += 1
         
         # 4. 공급자 정보
-        ws[f'A{current_row}'] = "공급자"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws.merge_cells(f'A{current_row}:A{current_row+2}')
-        
-        ws[f'B{current_row}'] = "사업자번호"
-        ws[f'B{current_row}'].font = small_font
-        ws[f'B{current_row}'].fill = light_gray_fill
-        ws[f'B{current_row}'].border = thin_border
-        ws[f'C{current_row}'] = business_number
-        ws[f'C{current_row}'].font = small_font
-        ws[f'C{current_row}'].border = thin_border
-        ws[f'D{current_row}'] = "상호"
-        ws[f'D{current_row}'].font = small_font
-        ws[f'D{current_row}'].fill = light_gray_fill
-        ws[f'D{current_row}'].border = thin_border
-        ws.merge_cells(f'E{current_row}:F{current_row}')
-        ws[f'E{current_row}'] = company_name
-        ws[f'E{current_row}'].font = small_font
-        ws[f'E{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=1, value="공급자")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row + 2, end_column=1)
+        
+        c = ws.cell(row=current_row, column=2, value="사업자번호")
+        c.font = small_font
+        c.fill = light_gray_fill
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=3, value=business_number)
+        c.font = small_font
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=4, value="상호")
+        c.font = small_font
+        c.fill = light_gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=5, value=company_name)
+        c.font = small_font
+        c.border = thin_border
         current_row += 1
         
-        ws[f'B{current_row}'] = "소재지"
-        ws[f'B{current_row}'].font = small_font
-        ws[f'B{current_row}'].fill = light_gray_fill
-        ws[f'B{current_row}'].border = thin_border
-        ws.merge_cells(f'C{current_row}:F{current_row}')
-        ws[f'C{current_row}'] = address
-        ws[f'C{current_row}'].font = small_font
-        ws[f'C{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=2, value="소재지")
+        c.font = small_font
+        c.fill = light_gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=3, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=3, value=address)
+        c.font = small_font
+        c.border = thin_border
         current_row += 1
         
-        ws[f'B{current_row}'] = "업태"
-        ws[f'B{current_row}'].font = small_font
-        ws[f'B{current_row}'].fill = light_gray_fill
-        ws[f'B{current_row}'].border = thin_border
-        ws[f'C{current_row}'] = business_type
-        ws[f'C{current_row}'].font = small_font
-        ws[f'C{current_row}'].border = thin_border
-        ws[f'D{current_row}'] = "종목"
-        ws[f'D{current_row}'].font = small_font
-        ws[f'D{current_row}'].fill = light_gray_fill
-        ws[f'D{current_row}'].border = thin_border
-        ws.merge_cells(f'E{current_row}:F{current_row}')
-        ws[f'E{current_row}'] = business_item
-        ws[f'E{current_row}'].font = small_font
-        ws[f'E{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=2, value="업태")
+        c.font = small_font
+        c.fill = light_gray_fill
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=3, value=business_type)
+        c.font = small_font
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=4, value="종목")
+        c.font = small_font
+        c.fill = light_gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=5, value=business_item)
+        c.font = small_font
+        c.border = thin_border
         current_row += 2
         
         # 5. 항목 테이블 헤더
@@ -584,27 +798,31 @@ async def export_single_invoice_xlsx(invoice_id: int):
             cell.alignment = center_align
         current_row += 1
         
-        # 항목 데이터
+        # 항목 데이터 (셀을 한 번만 잡고 값/스타일을 같이 적용 — 재조회 루프 제거)
         subtotal = 0
-        for idx, (_, row) in enumerate(items_df.iterrows(), 1):
-            qty = int(row['수량']) if pd.notna(row['수량']) else 0
-            unit_price = int(row['단가']) if pd.notna(row['단가']) else 0
-            amount = int(row['금액']) if pd.notna(row['금액']) else qty * unit_price
+        for idx, row in enumerate(items, 1):
+            qty = int(row['수량']) if row['수량'] is not None else 0
+            unit_price = int(row['단가']) if row['단가'] is not None else 0
+            amount = int(row['금액']) if row['금액'] is not None else qty * unit_price
             subtotal += amount
-            
-            ws.cell(row=current_row, column=1, value=idx).border = thin_border
-            ws.cell(row=current_row, column=1).alignment = center_align
-            ws.cell(row=current_row, column=2, value=str(row['항목'])).border = thin_border
-            ws.cell(row=current_row, column=3, value=f"{qty:,}" if qty else "").border = thin_border
-            ws.cell(row=current_row, column=3).alignment = right_align
-            ws.cell(row=current_row, column=4, value=f"{unit_price:,}" if unit_price else "").border = thin_border
-            ws.cell(row=current_row, column=4).alignment = right_align
-            ws.cell(row=current_row, column=5, value=f"{amount:,}" if amount else "").border = thin_border
-            ws.cell(row=current_row, column=5).alignment = right_align
-            ws.cell(row=current_row, column=6, value=str(row['비고']) if pd.notna(row['비고']) else "").border = thin_border
-            
-            for col in range(1, 7):
-                ws.cell(row=current_row, column=col).font = body_font
+
+            values = (
+                idx, str(row['항목']),
+                qty if qty else "",
+                unit_price if unit_price else "",
+                amount if amount else "",
+                str(row['비고']) if row['비고'] is not None else ""
+            )
+            aligns = (center_align, None, right_align, right_align, right_align, None)
+            fmts = (None, None, _NUM_FMT, _NUM_FMT, _NUM_FMT, None)
+            for col, (value, align, fmt) in enumerate(zip(values, aligns, fmts), 1):
+                c = ws.cell(row=current_row, column=col, value=value)
+                c.border = thin_border
+                c.font = body_font
+                if align is not None:
+                    c.alignment = align
+                if fmt is not None:
+                    c.number_format = fmt
             current_row += 1
         
         current_row += 1
@@ -613,86 +831,84 @@ async def export_single_invoice_xlsx(invoice_id: int):
         vat = int(subtotal * 0.1)
         total = subtotal + vat
         
-        ws[f'A{current_row}'] = "합계 금액"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws[f'B{current_row}'] = f"₩ {subtotal:,}"
-        ws[f'B{current_row}'].font = body_font
-        ws[f'B{current_row}'].border = thin_border
-        ws[f'B{current_row}'].alignment = right_align
-        ws[f'C{current_row}'] = "부가세"
-        ws[f'C{current_row}'].font = header_font
-        ws[f'C{current_row}'].fill = gray_fill
-        ws[f'C{current_row}'].border = thin_border
-        ws[f'D{current_row}'] = f"₩ {vat:,}"
-        ws[f'D{current_row}'].font = body_font
-        ws[f'D{current_row}'].border = thin_border
-        ws[f'D{current_row}'].alignment = right_align
-        ws[f'E{current_row}'] = "청구금액"
-        ws[f'E{current_row}'].font = header_font
-        ws[f'E{current_row}'].fill = gray_fill
-        ws[f'E{current_row}'].border = thin_border
-        ws[f'F{current_row}'] = f"₩ {total:,}"
-        ws[f'F{current_row}'].font = Font(name='맑은 고딕', size=11, bold=True)
-        ws[f'F{current_row}'].border = thin_border
-        ws[f'F{current_row}'].alignment = right_align
+        c = ws.cell(row=current_row, column=1, value="합계 금액")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=2, value=subtotal)
+        c.number_format = _WON_FMT
+        c.font = body_font
+        c.border = thin_border
+        c.alignment = right_align
+        c = ws.cell(row=current_row, column=3, value="부가세")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=4, value=vat)
+        c.number_format = _WON_FMT
+        c.font = body_font
+        c.border = thin_border
+        c.alignment = right_align
+        c = ws.cell(row=current_row, column=5, value="청구금액")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        c = ws.cell(row=current_row, column=6, value=total)
+        c.number_format = _WON_FMT
+        c.font = S.total_font
+        c.border = thin_border
+        c.alignment = right_align
         current_row += 2
         
         # 7. 지급기한/계좌정보
-        ws[f'A{current_row}'] = "지급기한"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws.merge_cells(f'B{current_row}:F{current_row}')
-        ws[f'B{current_row}'] = payment_deadline
-        ws[f'B{current_row}'].font = body_font
-        ws[f'B{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=1, value="지급기한")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=2, value=payment_deadline)
+        c.font = body_font
+        c.border = thin_border
         current_row += 1
         
-        ws[f'A{current_row}'] = "계좌정보"
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].fill = gray_fill
-        ws[f'A{current_row}'].border = thin_border
-        ws.merge_cells(f'B{current_row}:F{current_row}')
-        ws[f'B{current_row}'] = f"{bank_name}  {account_number}  {account_holder}"
-        ws[f'B{current_row}'].font = body_font
-        ws[f'B{current_row}'].border = thin_border
+        c = ws.cell(row=current_row, column=1, value="계좌정보")
+        c.font = header_font
+        c.fill = gray_fill
+        c.border = thin_border
+        ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=2, value=f"{bank_name}  {account_number}  {account_holder}")
+        c.font = body_font
+        c.border = thin_border
         current_row += 3
         
         # 8. 하단 - 위와 같이 청구합니다
-        ws.merge_cells(f'A{current_row}:F{current_row}')
-        ws[f'A{current_row}'] = "위와 같이 청구합니다."
-        ws[f'A{current_row}'].font = header_font
-        ws[f'A{current_row}'].alignment = center_align
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=1, value="위와 같이 청구합니다.")
+        c.font = header_font
+        c.alignment = center_align
         current_row += 2
         
-        # 날짜 (한국어 형식)
-        try:
-            dt = datetime.strptime(invoice_date, "%Y-%m-%d")
-            weekdays = ['월', '화', '수', '목', '금', '토', '일']
-            date_str = f"{dt.year}년 {dt.month:02d}월 {dt.day:02d}일 {weekdays[dt.weekday()]}요일"
-        except:
-            date_str = invoice_date
+        # 날짜 (한국어 형식, 캐시)
+        date_str = _korean_date_str(invoice_date)
         
-        ws.merge_cells(f'A{current_row}:F{current_row}')
-        ws[f'A{current_row}'] = date_str
-        ws[f'A{current_row}'].font = body_font
-        ws[f'A{current_row}'].alignment = center_align
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=1, value=date_str)
+        c.font = body_font
+        c.alignment = center_align
         current_row += 2
         
         # 회사명
-        ws.merge_cells(f'A{current_row}:F{current_row}')
-        ws[f'A{current_row}'] = company_name
-        ws[f'A{current_row}'].font = title_font
-        ws[f'A{current_row}'].alignment = center_align
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=1, value=company_name)
+        c.font = title_font
+        c.alignment = center_align
         current_row += 1
         
         # 담당자/대표자 정보
-        ws.merge_cells(f'A{current_row}:F{current_row}')
-        ws[f'A{current_row}'] = f"담당: {confirmed_by or '-'}  /  대표: {representative or '-'}"
-        ws[f'A{current_row}'].font = small_font
-        ws[f'A{current_row}'].alignment = center_align
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+        c = ws.cell(row=current_row, column=1, value=f"담당: {confirmed_by or '-'}  /  대표: {representative or '-'}")
+        c.font = small_font
+        c.alignment = center_align
         
         # 열 너비 조정
         ws.column_dimensions['A'].width = 12
@@ -702,16 +918,12 @@ async def export_single_invoice_xlsx(invoice_id: int):
         ws.column_dimensions['E'].width = 15
         ws.column_dimensions['F'].width = 25
         
-        # 엑셀 저장
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
+        # 엑셀 저장 (청크 스트리밍)
         period = period_from[:7] if period_from else ''
         ascii_filename = f"invoice_{invoice_id}_{period}.xlsx"
-        
+
         return StreamingResponse(
-            output,
+            _stream_workbook(wb),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": f"attachment; filename={ascii_filename}"
@@ -725,14 +937,14 @@ async def export_single_invoice_xlsx(invoice_id: int):
 
 
 @router.get("/{invoice_id}")
-async def get_invoice_detail(invoice_id: int):
+def get_invoice_detail(invoice_id: int):
     """인보이스 상세 조회"""
     try:
         with get_connection() as con:
-            # 인보이스 기본 정보
-            inv_df = pd.read_sql(
+            # 인보이스 기본 정보 (단건 조회는 DataFrame 없이 커서로 직접 처리)
+            inv = con.execute(
                 """
-                SELECT 
+                SELECT
                     i.invoice_id,
                     i.vendor_id,
                     COALESCE(v.name, v.vendor) as vendor_name,
@@ -745,38 +957,34 @@ async def get_invoice_detail(invoice_id: int):
                 LEFT JOIN vendors v ON i.vendor_id = v.vendor_id
                 WHERE i.invoice_id = ?
                 """,
-                con, params=[invoice_id]
-            )
-            
-            if inv_df.empty:
+                (invoice_id,)
+            ).fetchone()
+
+            if inv is None:
                 raise HTTPException(status_code=404, detail="Invoice not found")
-            
-            inv = inv_df.iloc[0]
-            
+
             # 인보이스 항목
-            items_df = pd.read_sql(
+            item_rows = con.execute(
                 "SELECT item_name, qty, unit_price, amount, remark FROM invoice_items WHERE invoice_id = ?",
-                con, params=[invoice_id]
-            )
-            
-            items = []
-            for _, row in items_df.iterrows():
-                items.append({
-                    "항목": str(row['item_name']) if row['item_name'] else '',
-                    "수량": int(row['qty']) if pd.notna(row['qty']) else 0,
-                    "단가": int(row['unit_price']) if pd.notna(row['unit_price']) else 0,
-                    "금액": int(row['amount']) if pd.notna(row['amount']) else 0,
-                    "비고": str(row['remark']) if row['remark'] else ''
-                })
-            
+                (invoice_id,)
+            ).fetchall()
+
+            items = [{
+                "항목": str(r[0]) if r[0] else '',
+                "수량": int(r[1]) if r[1] is not None else 0,
+                "단가": int(r[2]) if r[2] is not None else 0,
+                "금액": int(r[3]) if r[3] is not None else 0,
+                "비고": str(r[4]) if r[4] else ''
+            } for r in item_rows]
+
             return {
-                "invoice_id": int(inv['invoice_id']),
-                "vendor": str(inv['vendor_name']) if inv['vendor_name'] else '',
-                "period_from": str(inv['period_from']) if inv['period_from'] else '',
-                "period_to": str(inv['period_to']) if inv['period_to'] else '',
-                "total_amount": int(inv['total_amount']) if pd.notna(inv['total_amount']) else 0,
-                "status": str(inv['status']),
-                "created_at": str(inv['created_at']) if inv['created_at'] else '',
+                "invoice_id": int(inv[0]),
+                "vendor": str(inv[2]) if inv[2] else '',
+                "period_from": str(inv[3]) if inv[3] else '',
+                "period_to": str(inv[4]) if inv[4] else '',
+                "total_amount": int(inv[5]) if inv[5] is not None else 0,
+                "status": str(inv[6]),
+                "created_at": str(inv[7]) if inv[7] else '',
                 "items": items
             }
     
@@ -787,15 +995,15 @@ async def get_invoice_detail(invoice_id: int):
 
 
 @router.delete("/{invoice_id}")
-async def delete_invoice(invoice_id: int, token: Optional[str] = None):
+def delete_invoice(invoice_id: int, token: Optional[str] = None):
     """인보이스 삭제 (관리자만)"""
-    # 관리자 권한 체크
-    is_admin, nickname = check_admin(token)
-    if not is_admin:
-        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
-    
     try:
         with get_connection() as con:
+            # 관리자 권한 체크 (같은 커넥션 재사용)
+            is_admin, nickname = resolve_session(con, token)
+            if not is_admin:
+                raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
             # 삭제 전 인보이스 정보 가져오기
             inv = con.execute(
                 "SELECT vendor_id FROM invoices WHERE invoice_id = ?", (invoice_id,)
@@ -804,18 +1012,20 @@ async def delete_invoice(invoice_id: int, token: Optional[str] = None):
             
             con.execute("DELETE FROM invoice_items WHERE invoice_id = ?", (invoice_id,))
             con.execute("DELETE FROM invoices WHERE invoice_id = ?", (invoice_id,))
+
+            # 로그도 같은 트랜잭션에 기록
+            add_log(
+                action_type="인보이스 삭제",
+                target_type="invoice",
+                target_id=str(invoice_id),
+                target_name=vendor_name,
+                user_nickname=nickname,
+                details=f"인보이스 ID {invoice_id} 삭제",
+                con=con
+            )
             con.commit()
-        
-        # 로그 기록
-        add_log(
-            action_type="인보이스 삭제",
-            target_type="invoice",
-            target_id=str(invoice_id),
-            target_name=vendor_name,
-            user_nickname=nickname,
-            details=f"인보이스 ID {invoice_id} 삭제"
-        )
-        
+        _bump_invoices_version()
+
         return {"status": "success", "deleted": invoice_id}
     except HTTPException:
         raise
@@ -824,89 +1034,84 @@ async def delete_invoice(invoice_id: int, token: Optional[str] = None):
 
 
 @router.post("/{invoice_id}/confirm")
-async def confirm_invoice(invoice_id: int, token: Optional[str] = None, user_nickname: Optional[str] = None):
+def confirm_invoice(invoice_id: int, token: Optional[str] = None, user_nickname: Optional[str] = None):
     """인보이스 확정"""
     try:
         with get_connection() as con:
-            # 컬럼 존재 확인 및 추가
-            ensure_invoice_user_columns(con)
-            
             # 사용자 닉네임 가져오기
             nickname = user_nickname or get_nickname_from_token(con, token) or '시스템'
-            
-            # 인보이스 정보 가져오기
+
+            # SELECT 후 UPDATE 대신 RETURNING으로 한 번에 처리
             inv = con.execute(
-                "SELECT vendor_id FROM invoices WHERE invoice_id = ?", (invoice_id,)
+                "UPDATE invoices SET status = '확정', confirmed_by = ?, confirmed_at = CURRENT_TIMESTAMP "
+                "WHERE invoice_id = ? RETURNING vendor_id",
+                (nickname, invoice_id)
             ).fetchone()
             vendor_name = inv[0] if inv else "알 수 없음"
-            
-            con.execute(
-                "UPDATE invoices SET status = '확정', confirmed_by = ?, confirmed_at = CURRENT_TIMESTAMP WHERE invoice_id = ?",
-                (nickname, invoice_id)
+
+            # 로그도 같은 트랜잭션에 기록
+            add_log(
+                action_type="인보이스 확정",
+                target_type="invoice",
+                target_id=str(invoice_id),
+                target_name=vendor_name,
+                user_nickname=nickname,
+                details=f"인보이스 ID {invoice_id} 확정 처리",
+                con=con
             )
             con.commit()
-        
-        # 로그 기록
-        add_log(
-            action_type="인보이스 확정",
-            target_type="invoice",
-            target_id=str(invoice_id),
-            target_name=vendor_name,
-            user_nickname=nickname,
-            details=f"인보이스 ID {invoice_id} 확정 처리"
-        )
-        
+        _bump_invoices_version()
+
         return {"status": "success", "invoice_id": invoice_id, "new_status": "확정", "confirmed_by": nickname}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/{invoice_id}/unconfirm")
-async def unconfirm_invoice(invoice_id: int, token: Optional[str] = None, user_nickname: Optional[str] = None):
+def unconfirm_invoice(invoice_id: int, token: Optional[str] = None, user_nickname: Optional[str] = None):
     """인보이스 미확정으로 변경"""
     try:
         with get_connection() as con:
-            # 컬럼 존재 확인 및 추가
-            ensure_invoice_user_columns(con)
-            
             # 사용자 닉네임 가져오기
             nickname = user_nickname or get_nickname_from_token(con, token) or '시스템'
-            
-            # 인보이스 정보 가져오기
+
+            # SELECT 후 UPDATE 대신 RETURNING으로 한 번에 처리
             inv = con.execute(
-                "SELECT vendor_id FROM invoices WHERE invoice_id = ?", (invoice_id,)
+                "UPDATE invoices SET status = '미확정', confirmed_by = NULL, confirmed_at = NULL, "
+                "modified_by = ?, modified_at = CURRENT_TIMESTAMP WHERE invoice_id = ? RETURNING vendor_id",
+                (nickname, invoice_id)
             ).fetchone()
             vendor_id = inv[0] if inv else "알 수 없음"
-            
-            con.execute(
-                "UPDATE invoices SET status = '미확정', confirmed_by = NULL, confirmed_at = NULL, modified_by = ?, modified_at = CURRENT_TIMESTAMP WHERE invoice_id = ?",
-                (nickname, invoice_id)
+
+            # 로그도 같은 트랜잭션에 기록
+            add_log(
+                action_type="인보이스 미확정",
+                target_type="invoice",
+                target_id=str(invoice_id),
+                target_name=vendor_id,
+                user_nickname=nickname,
+                details=f"인보이스 ID {invoice_id} 미확정 처리",
+                con=con
             )
             con.commit()
-        
-        # 로그 기록
-        add_log(
-            action_type="인보이스 미확정",
-            target_type="invoice",
-            target_id=str(invoice_id),
-            target_name=vendor_id,
-            user_nickname=nickname,
-            details=f"인보이스 ID {invoice_id} 미확정 처리"
-        )
-        
+        _bump_invoices_version()
+
         return {"status": "success", "invoice_id": invoice_id, "new_status": "미확정", "modified_by": nickname}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 class InvoiceItemUpdate(BaseModel):
-    항목: str
-    수량: int
-    단가: int
-    금액: int
-    비고: str = ""
+    # 와이어 포맷은 한글 키 그대로, 코드에서는 DB 컬럼과 같은 ASCII 속성명 사용
+    model_config = ConfigDict(populate_by_name=True)
+
+    item_name: str = Field(alias='항목')
+    qty: int = Field(alias='수량')
+    unit_price: int = Field(alias='단가')
+    amount: int = Field(alias='금액')
+    remark: str = Field(default='', alias='비고')
 
 class InvoiceUpdateRequest(BaseModel):
     items: List[InvoiceItemUpdate]
@@ -914,7 +1119,8 @@ class InvoiceUpdateRequest(BaseModel):
 
 
 def ensure_invoice_user_columns(con):
-    """인보이스 테이블에 사용자 관련 컬럼 추가"""
+    """인보이스 테이블에 사용자 관련 컬럼 추가 (기동 시 ensure_tables가 수행)"""
+    global _INVOICE_COLS
     cols = [c[1] for c in con.execute("PRAGMA table_info(invoices);")]
     if 'modified_by' not in cols:
         con.execute("ALTER TABLE invoices ADD COLUMN modified_by TEXT;")
@@ -924,73 +1130,62 @@ def ensure_invoice_user_columns(con):
         con.execute("ALTER TABLE invoices ADD COLUMN confirmed_by TEXT;")
     if 'confirmed_at' not in cols:
         con.execute("ALTER TABLE invoices ADD COLUMN confirmed_at DATETIME;")
+    # 스키마가 바뀌었을 수 있으니 모듈 캐시 무효화
+    _INVOICE_COLS = None
 
 
 def get_nickname_from_token(con, token: Optional[str]) -> Optional[str]:
     """토큰에서 사용자 닉네임 가져오기"""
-    if not token:
-        return None
-    try:
-        result = con.execute(
-            "SELECT u.nickname FROM sessions s JOIN users u ON s.user_id = u.user_id WHERE s.token = ?",
-            (token,)
-        ).fetchone()
-        return result[0] if result else None
-    except:
-        return None
+    return resolve_session(con, token)[1]
 
 
 @router.put("/{invoice_id}/items")
-async def update_invoice_items(invoice_id: int, request: InvoiceUpdateRequest, token: Optional[str] = None):
+def update_invoice_items(invoice_id: int, request: InvoiceUpdateRequest, token: Optional[str] = None):
     """인보이스 항목 수정"""
     try:
         with get_connection() as con:
-            # 컬럼 존재 확인 및 추가
-            ensure_invoice_user_columns(con)
-            
-            # 기존 인보이스 확인
-            existing = con.execute(
-                "SELECT invoice_id, vendor_id FROM invoices WHERE invoice_id = ?", (invoice_id,)
-            ).fetchone()
-            
-            if not existing:
-                raise HTTPException(status_code=404, detail="Invoice not found")
-            
-            vendor_name = existing[1] if existing[1] else "알 수 없음"
-            
             # 사용자 닉네임
             nickname = request.user_nickname or get_nickname_from_token(con, token) or '시스템'
-            
+
+            total_amount = sum(item.amount for item in request.items)
+
+            # 존재 확인 + 총액/수정자 갱신을 RETURNING으로 한 번에
+            # (없는 인보이스면 롤백되므로 아래 삭제/삽입도 무효)
+            row = con.execute(
+                "UPDATE invoices SET total_amount = ?, modified_by = ?, modified_at = CURRENT_TIMESTAMP "
+                "WHERE invoice_id = ? RETURNING vendor_id",
+                (total_amount, nickname, invoice_id)
+            ).fetchone()
+
+            if not row:
+                raise HTTPException(status_code=404, detail="Invoice not found")
+
+            vendor_name = row[0] if row[0] else "알 수 없음"
+
             # 기존 항목 삭제
             con.execute("DELETE FROM invoice_items WHERE invoice_id = ?", (invoice_id,))
-            
-            # 새 항목 삽입
-            total_amount = 0
-            for item in request.items:
-                con.execute(
-                    "INSERT INTO invoice_items (invoice_id, item_name, qty, unit_price, amount, remark) VALUES (?, ?, ?, ?, ?, ?)",
-                    (invoice_id, item.항목, item.수량, item.단가, item.금액, item.비고)
-                )
-                total_amount += item.금액
-            
-            # 총액 및 수정자 업데이트
-            con.execute(
-                "UPDATE invoices SET total_amount = ?, modified_by = ?, modified_at = CURRENT_TIMESTAMP WHERE invoice_id = ?",
-                (total_amount, nickname, invoice_id)
+
+            # 새 항목 삽입 (항목별 execute 대신 executemany로 일괄 처리)
+            con.executemany(
+                "INSERT INTO invoice_items (invoice_id, item_name, qty, unit_price, amount, remark) VALUES (?, ?, ?, ?, ?, ?)",
+                [(invoice_id, item.item_name, item.qty, item.unit_price, item.amount, item.remark)
+                 for item in request.items]
+            )
+
+            # 로그도 같은 트랜잭션에 기록
+            add_log(
+                action_type="인보이스 수정",
+                target_type="invoice",
+                target_id=str(invoice_id),
+                target_name=vendor_name,
+                user_nickname=nickname,
+                details=f"인보이스 ID {invoice_id} 항목 수정, 총액: {total_amount:,}원",
+                con=con
             )
-            
             con.commit()
-        
-        # 로그 기록
-        add_log(
-            action_type="인보이스 수정",
-            target_type="invoice",
-            target_id=str(invoice_id),
-            target_name=vendor_name,
-            user_nickname=nickname,
-            details=f"인보이스 ID {invoice_id} 항목 수정, 총액: {total_amount:,}원"
-        )
-            
+        _bump_invoices_version()
+
+
         return {
             "status": "success",
             "invoice_id": invoice_id,
@@ -1005,30 +1200,39 @@ async def update_invoice_items(invoice_id: int, request: InvoiceUpdateRequest, t
 
 
 @router.delete("/batch/delete")
-async def delete_invoices_batch(invoice_ids: List[int], token: Optional[str] = None):
+def delete_invoices_batch(invoice_ids: List[int], token: Optional[str] = None):
     """인보이스 일괄 삭제 (관리자만)"""
-    # 관리자 권한 체크
-    is_admin, nickname = check_admin(token)
-    if not is_admin:
-        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
-    
     try:
         with get_connection() as con:
-            for iid in invoice_ids:
-                con.execute("DELETE FROM invoice_items WHERE invoice_id = ?", (iid,))
-                con.execute("DELETE FROM invoices WHERE invoice_id = ?", (iid,))
+            # 관리자 권한 체크 (같은 커넥션 재사용)
+            is_admin, nickname = resolve_session(con, token)
+            if not is_admin:
+                raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
+            # 쓰기 락을 선점해 청크 사이에 다른 커넥션이 끼어들지 않게 함
+            con.execute("BEGIN IMMEDIATE")
+
+            # ID별 개별 DELETE 대신 IN 절로 처리 (문장 2N개 → 청크당 2개, 단일 트랜잭션)
+            # SQLite 바인드 파라미터 한도(999)를 넘지 않도록 900개씩 나눔
+            for i in range(0, len(invoice_ids), 900):
+                chunk = invoice_ids[i:i + 900]
+                ph = ",".join("?" * len(chunk))
+                con.execute(f"DELETE FROM invoice_items WHERE invoice_id IN ({ph})", chunk)
+                con.execute(f"DELETE FROM invoices WHERE invoice_id IN ({ph})", chunk)
+
+            # 로그도 같은 트랜잭션에 기록
+            add_log(
+                action_type="인보이스 일괄 삭제",
+                target_type="invoice",
+                target_id=",".join(str(i) for i in invoice_ids),
+                target_name=f"{len(invoice_ids)}건",
+                user_nickname=nickname,
+                details=f"인보이스 {len(invoice_ids)}건 일괄 삭제: {invoice_ids}",
+                con=con
+            )
             con.commit()
-        
-        # 로그 기록
-        add_log(
-            action_type="인보이스 일괄 삭제",
-            target_type="invoice",
-            target_id=",".join(str(i) for i in invoice_ids),
-            target_name=f"{len(invoice_ids)}건",
-            user_nickname=nickname,
-            details=f"인보이스 {len(invoice_ids)}건 일괄 삭제: {invoice_ids}"
-        )
-        
+        _bump_invoices_version()
+
         return {"status": "success", "deleted_count": len(invoice_ids)}
     except HTTPException:
         raise
@@ -1036,30 +1240,20 @@ async def delete_invoices_batch(invoice_ids: List[int], token: Optional[str] = N
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _create_invoice_sheet(ws, invoice_data: dict, items_df, company_info: dict):
-    """인보이스 시트 생성 헬퍼 함수 (PDF와 동일한 양식)"""
+def _create_invoice_sheet(ws, invoice_data: dict, items, company_info: dict):
+    """인보이스 시트 생성 헬퍼 함수 (PDF와 동일한 양식)
+
+    items는 dict 리스트 또는 DataFrame 모두 허용.
+    """
     from datetime import datetime
-    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-    
+
     # 스타일 정의
-    title_font = Font(name='맑은 고딕', size=18, bold=True)
-    header_font = Font(name='맑은 고딕', size=10, bold=True)
-    body_font = Font(name='맑은 고딕', size=9)
-    small_font = Font(name='맑은 고딕', size=8)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    gray_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-    light_gray_fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
-    
-    center_align = Alignment(horizontal='center', vertical='center')
-    left_align = Alignment(horizontal='left', vertical='center')
-    right_align = Alignment(horizontal='right', vertical='center')
+    S = _xlsx_styles()
+    title_font, header_font = S.title_font, S.header_font
+    body_font, small_font = S.body_font, S.small_font
+    thin_border = S.thin_border
+    gray_fill, light_gray_fill = S.gray_fill, S.light_gray_fill
+    center_align, left_align, right_align = S.center_align, S.left_align, S.right_align
     
     # 데이터 추출
     invoice_id = invoice_data['invoice_id']
@@ -1091,115 +1285,106 @@ def _create_invoice_sheet(ws, invoice_data: dict, items_df, company_info: dict):
     doc_number = f"{invoice_id:05d}-{invoice_date.replace('-', '')[:6]}"
     
     # 지급기한
-    if period_from:
-        try:
-            from dateutil.relativedelta import relativedelta
-            period_dt = datetime.strptime(period_from[:10], "%Y-%m-%d")
-            next_month = period_dt + relativedelta(months=1)
-            payment_deadline = f"{next_month.year}년 {next_month.month:02d}월 05일"
-        except:
-            payment_deadline = ""
-    else:
-        payment_deadline = ""
+    payment_deadline = _payment_deadline(period_from)
     
     current_row = 1
     
     # 1. 제목
-    ws.merge_cells(f'A{current_row}:F{current_row}')
-    ws[f'A{current_row}'] = "물류대행 서비스 대금청구서"
-    ws[f'A{current_row}'].font = title_font
-    ws[f'A{current_row}'].alignment = center_align
+    ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=1, value="물류대행 서비스 대금청구서")
+    c.font = title_font
+    c.alignment = center_align
     current_row += 2
     
     # 2. 문서번호/청구일자
-    ws[f'A{current_row}'] = "문서번호"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws.merge_cells(f'B{current_row}:C{current_row}')
-    ws[f'B{current_row}'] = doc_number
-    ws[f'B{current_row}'].font = body_font
-    ws[f'B{current_row}'].border = thin_border
-    ws[f'D{current_row}'] = "청구일자"
-    ws[f'D{current_row}'].font = header_font
-    ws[f'D{current_row}'].fill = gray_fill
-    ws[f'D{current_row}'].border = thin_border
-    ws.merge_cells(f'E{current_row}:F{current_row}')
-    ws[f'E{current_row}'] = invoice_date
-    ws[f'E{current_row}'].font = body_font
-    ws[f'E{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=1, value="문서번호")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=3)
+    c = ws.cell(row=current_row, column=2, value=doc_number)
+    c.font = body_font
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=4, value="청구일자")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=5, value=invoice_date)
+    c.font = body_font
+    c.border = thin_border
     current_row += 1
     
     # 3. 수신/건명
-    ws[f'A{current_row}'] = "수신"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws.merge_cells(f'B{current_row}:F{current_row}')
-    ws[f'B{current_row}'] = recipient_name
-    ws[f'B{current_row}'].font = body_font
-    ws[f'B{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=1, value="수신")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=2, value=recipient_name)
+    c.font = body_font
+    c.border = thin_border
     current_row += 1
     
-    ws[f'A{current_row}'] = "건명"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws.merge_cells(f'B{current_row}:F{current_row}')
-    ws[f'B{current_row}'] = title
-    ws[f'B{current_row}'].font = body_font
-    ws[f'B{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=1, value="건명")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=2, value=title)
+    c.font = body_font
+    c.border = thin_border
     current_row += 1
     
     # 4. 공급자 정보
-    ws[f'A{current_row}'] = "공급자"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws.merge_cells(f'A{current_row}:A{current_row+2}')
+    c = ws.cell(row=current_row, column=1, value="공급자")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row + 2, end_column=1)
     
-    ws[f'B{current_row}'] = "사업자번호"
-    ws[f'B{current_row}'].font = small_font
-    ws[f'B{current_row}'].fill = light_gray_fill
-    ws[f'B{current_row}'].border = thin_border
-    ws[f'C{current_row}'] = business_number
-    ws[f'C{current_row}'].font = small_font
-    ws[f'C{current_row}'].border = thin_border
-    ws[f'D{current_row}'] = "상호"
-    ws[f'D{current_row}'].font = small_font
-    ws[f'D{current_row}'].fill = light_gray_fill
-    ws[f'D{current_row}'].border = thin_border
-    ws.merge_cells(f'E{current_row}:F{current_row}')
-    ws[f'E{current_row}'] = company_name
-    ws[f'E{current_row}'].font = small_font
-    ws[f'E{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=2, value="사업자번호")
+    c.font = small_font
+    c.fill = light_gray_fill
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=3, value=business_number)
+    c.font = small_font
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=4, value="상호")
+    c.font = small_font
+    c.fill = light_gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=5, value=company_name)
+    c.font = small_font
+    c.border = thin_border
     current_row += 1
     
-    ws[f'B{current_row}'] = "소재지"
-    ws[f'B{current_row}'].font = small_font
-    ws[f'B{current_row}'].fill = light_gray_fill
-    ws[f'B{current_row}'].border = thin_border
-    ws.merge_cells(f'C{current_row}:F{current_row}')
-    ws[f'C{current_row}'] = address
-    ws[f'C{current_row}'].font = small_font
-    ws[f'C{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=2, value="소재지")
+    c.font = small_font
+    c.fill = light_gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=3, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=3, value=address)
+    c.font = small_font
+    c.border = thin_border
     current_row += 1
     
-    ws[f'B{current_row}'] = "업태"
-    ws[f'B{current_row}'].font = small_font
-    ws[f'B{current_row}'].fill = light_gray_fill
-    ws[f'B{current_row}'].border = thin_border
-    ws[f'C{current_row}'] = business_type
-    ws[f'C{current_row}'].font = small_font
-    ws[f'C{current_row}'].border = thin_border
-    ws[f'D{current_row}'] = "종목"
-    ws[f'D{current_row}'].font = small_font
-    ws[f'D{current_row}'].fill = light_gray_fill
-    ws[f'D{current_row}'].border = thin_border
-    ws.merge_cells(f'E{current_row}:F{current_row}')
-    ws[f'E{current_row}'] = business_item
-    ws[f'E{current_row}'].font = small_font
-    ws[f'E{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=2, value="업태")
+    c.font = small_font
+    c.fill = light_gray_fill
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=3, value=business_type)
+    c.font = small_font
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=4, value="종목")
+    c.font = small_font
+    c.fill = light_gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=5, value=business_item)
+    c.font = small_font
+    c.border = thin_border
     current_row += 2
     
     # 5. 항목 테이블 헤더
@@ -1212,29 +1397,34 @@ def _create_invoice_sheet(ws, invoice_data: dict, items_df, company_info: dict):
         cell.alignment = center_align
     current_row += 1
     
-    # 항목 데이터
+    # 항목 데이터 (셀을 한 번만 잡고 값/스타일을 같이 적용 — 재조회 루프 제거)
+    rows = items if isinstance(items, list) else items.to_dict('records')
     subtotal = 0
-    for idx, (_, row) in enumerate(items_df.iterrows(), 1):
+    for idx, row in enumerate(rows, 1):
         qty = int(row.get('수량', row.get('qty', 0))) if pd.notna(row.get('수량', row.get('qty'))) else 0
         unit_price = int(row.get('단가', row.get('unit_price', 0))) if pd.notna(row.get('단가', row.get('unit_price'))) else 0
         amount = int(row.get('금액', row.get('amount', qty * unit_price))) if pd.notna(row.get('금액', row.get('amount'))) else qty * unit_price
         item_name = str(row.get('항목', row.get('item_name', '')))
         remark = str(row.get('비고', row.get('remark', ''))) if pd.notna(row.get('비고', row.get('remark'))) else ""
         subtotal += amount
-        
-        ws.cell(row=current_row, column=1, value=idx).border = thin_border
-        ws.cell(row=current_row, column=1).alignment = center_align
-        ws.cell(row=current_row, column=2, value=item_name).border = thin_border
-        ws.cell(row=current_row, column=3, value=f"{qty:,}" if qty else "").border = thin_border
-        ws.cell(row=current_row, column=3).alignment = right_align
-        ws.cell(row=current_row, column=4, value=f"{unit_price:,}" if unit_price else "").border = thin_border
-        ws.cell(row=current_row, column=4).alignment = right_align
-        ws.cell(row=current_row, column=5, value=f"{amount:,}" if amount else "").border = thin_border
-        ws.cell(row=current_row, column=5).alignment = right_align
-        ws.cell(row=current_row, column=6, value=remark).border = thin_border
-        
-        for col in range(1, 7):
-            ws.cell(row=current_row, column=col).font = body_font
+
+        values = (
+            idx, item_name,
+            qty if qty else "",
+            unit_price if unit_price else "",
+            amount if amount else "",
+            remark
+        )
+        aligns = (center_align, None, right_align, right_align, right_align, None)
+        fmts = (None, None, _NUM_FMT, _NUM_FMT, _NUM_FMT, None)
+        for col, (value, align, fmt) in enumerate(zip(values, aligns, fmts), 1):
+            c = ws.cell(row=current_row, column=col, value=value)
+            c.border = thin_border
+            c.font = body_font
+            if align is not None:
+                c.alignment = align
+            if fmt is not None:
+                c.number_format = fmt
         current_row += 1
     
     current_row += 1
@@ -1243,86 +1433,84 @@ def _create_invoice_sheet(ws, invoice_data: dict, items_df, company_info: dict):
     vat = int(subtotal * 0.1)
     total = subtotal + vat
     
-    ws[f'A{current_row}'] = "합계 금액"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws[f'B{current_row}'] = f"₩ {subtotal:,}"
-    ws[f'B{current_row}'].font = body_font
-    ws[f'B{current_row}'].border = thin_border
-    ws[f'B{current_row}'].alignment = right_align
-    ws[f'C{current_row}'] = "부가세"
-    ws[f'C{current_row}'].font = header_font
-    ws[f'C{current_row}'].fill = gray_fill
-    ws[f'C{current_row}'].border = thin_border
-    ws[f'D{current_row}'] = f"₩ {vat:,}"
-    ws[f'D{current_row}'].font = body_font
-    ws[f'D{current_row}'].border = thin_border
-    ws[f'D{current_row}'].alignment = right_align
-    ws[f'E{current_row}'] = "청구금액"
-    ws[f'E{current_row}'].font = header_font
-    ws[f'E{current_row}'].fill = gray_fill
-    ws[f'E{current_row}'].border = thin_border
-    ws[f'F{current_row}'] = f"₩ {total:,}"
-    ws[f'F{current_row}'].font = Font(name='맑은 고딕', size=11, bold=True)
-    ws[f'F{current_row}'].border = thin_border
-    ws[f'F{current_row}'].alignment = right_align
+    c = ws.cell(row=current_row, column=1, value="합계 금액")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=2, value=subtotal)
+    c.number_format = _WON_FMT
+    c.font = body_font
+    c.border = thin_border
+    c.alignment = right_align
+    c = ws.cell(row=current_row, column=3, value="부가세")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=4, value=vat)
+    c.number_format = _WON_FMT
+    c.font = body_font
+    c.border = thin_border
+    c.alignment = right_align
+    c = ws.cell(row=current_row, column=5, value="청구금액")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    c = ws.cell(row=current_row, column=6, value=total)
+    c.number_format = _WON_FMT
+    c.font = S.total_font
+    c.border = thin_border
+    c.alignment = right_align
     current_row += 2
     
     # 7. 지급기한/계좌정보
-    ws[f'A{current_row}'] = "지급기한"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws.merge_cells(f'B{current_row}:F{current_row}')
-    ws[f'B{current_row}'] = payment_deadline
-    ws[f'B{current_row}'].font = body_font
-    ws[f'B{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=1, value="지급기한")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=2, value=payment_deadline)
+    c.font = body_font
+    c.border = thin_border
     current_row += 1
     
-    ws[f'A{current_row}'] = "계좌정보"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = gray_fill
-    ws[f'A{current_row}'].border = thin_border
-    ws.merge_cells(f'B{current_row}:F{current_row}')
-    ws[f'B{current_row}'] = f"{bank_name}  {account_number}  {account_holder}"
-    ws[f'B{current_row}'].font = body_font
-    ws[f'B{current_row}'].border = thin_border
+    c = ws.cell(row=current_row, column=1, value="계좌정보")
+    c.font = header_font
+    c.fill = gray_fill
+    c.border = thin_border
+    ws.merge_cells(start_row=current_row, start_column=2, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=2, value=f"{bank_name}  {account_number}  {account_holder}")
+    c.font = body_font
+    c.border = thin_border
     current_row += 3
     
     # 8. 하단 - 위와 같이 청구합니다
-    ws.merge_cells(f'A{current_row}:F{current_row}')
-    ws[f'A{current_row}'] = "위와 같이 청구합니다."
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].alignment = center_align
+    ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=1, value="위와 같이 청구합니다.")
+    c.font = header_font
+    c.alignment = center_align
     current_row += 2
     
-    # 날짜 (한국어 형식)
-    try:
-        dt = datetime.strptime(invoice_date, "%Y-%m-%d")
-        weekdays = ['월', '화', '수', '목', '금', '토', '일']
-        date_str = f"{dt.year}년 {dt.month:02d}월 {dt.day:02d}일 {weekdays[dt.weekday()]}요일"
-    except:
-        date_str = invoice_date
+    # 날짜 (한국어 형식, 캐시)
+    date_str = _korean_date_str(invoice_date)
     
-    ws.merge_cells(f'A{current_row}:F{current_row}')
-    ws[f'A{current_row}'] = date_str
-    ws[f'A{current_row}'].font = body_font
-    ws[f'A{current_row}'].alignment = center_align
+    ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=1, value=date_str)
+    c.font = body_font
+    c.alignment = center_align
     current_row += 2
     
     # 회사명
-    ws.merge_cells(f'A{current_row}:F{current_row}')
-    ws[f'A{current_row}'] = company_name
-    ws[f'A{current_row}'].font = title_font
-    ws[f'A{current_row}'].alignment = center_align
+    ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=1, value=company_name)
+    c.font = title_font
+    c.alignment = center_align
     current_row += 1
     
     # 담당자/대표자 정보
-    ws.merge_cells(f'A{current_row}:F{current_row}')
-    ws[f'A{current_row}'] = f"담당: {confirmed_by or '-'}  /  대표: {representative or '-'}"
-    ws[f'A{current_row}'].font = small_font
-    ws[f'A{current_row}'].alignment = center_align
+    ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+    c = ws.cell(row=current_row, column=1, value=f"담당: {confirmed_by or '-'}  /  대표: {representative or '-'}")
+    c.font = small_font
+    c.alignment = center_align
     
     # 열 너비 조정
     ws.column_dimensions['A'].width = 12
@@ -1334,7 +1522,7 @@ def _create_invoice_sheet(ws, invoice_data: dict, items_df, company_info: dict):
 
 
 @router.get("/export/xlsx")
-async def export_invoices_xlsx(
+def export_invoices_xlsx(
     period: Optional[str] = None,
     vendor: Optional[str] = None,
     invoice_ids: Optional[str] = None  # comma-separated
@@ -1343,20 +1531,19 @@ async def export_invoices_xlsx(
     try:
         from datetime import datetime
         from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-        import re
-        
+
         with get_connection() as con:
-            # ID 목록 파싱
+            # ID 목록 파싱 (콤마 목록을 C 레벨에서 한 번에 파싱)
             ids_list = None
-            if invoice_ids:
-                ids_list = [int(x.strip()) for x in invoice_ids.split(',') if x.strip()]
+            if invoice_ids and invoice_ids.strip():
+                import numpy as np
+                ids_list = np.fromstring(invoice_ids, sep=',', dtype=np.int64).tolist()
+                ids_list = ids_list or None
             
-            # 인보이스 컬럼 확인
-            cols = [c[1] for c in con.execute("PRAGMA table_info(invoices);")]
-            has_confirmed_by = 'confirmed_by' in cols
+            # 인보이스 컬럼 확인 (모듈 캐시)
+            has_confirmed_by = 'confirmed_by' in _invoice_columns(con)
             
-            # 인보이스 조회
+            # 인보이스 + 항목을 JOIN 한 번으로 조회 (왕복 2회 → 1회)
             select_cols = """
                 i.invoice_id,
                 COALESCE(v.name, v.vendor, i.vendor_id) as vendor_name,
@@ -1367,53 +1554,59 @@ async def export_invoices_xlsx(
             """
             if has_confirmed_by:
                 select_cols += ", i.confirmed_by"
-            
+            select_cols += """,
+                it.item_name as 항목, it.qty as 수량, it.unit_price as 단가,
+                it.amount as 금액, it.remark as 비고"""
+
             query = f"""
                 SELECT {select_cols}
                 FROM invoices i
                 LEFT JOIN vendors v ON i.vendor_id = v.vendor_id
+                LEFT JOIN invoice_items it ON it.invoice_id = i.invoice_id
                 WHERE 1=1
             """
             params = []
-            
+
             if ids_list:
                 placeholders = ','.join(['?' for _ in ids_list])
                 query += f" AND i.invoice_id IN ({placeholders})"
                 params.extend(ids_list)
             elif period:
-                query += " AND strftime('%Y-%m', i.period_from) = ?"
+                query += " AND substr(i.period_from, 1, 7) = ?"
                 params.append(period)
-            
+
             if vendor:
                 query += " AND (v.vendor = ? OR v.name = ?)"
                 params.extend([vendor, vendor])
-            
-            query += " ORDER BY i.invoice_id DESC"
-            
-            inv_df = pd.read_sql(query, con, params=params)
-            
-            if inv_df.empty:
-                raise HTTPException(status_code=404, detail="No invoices found")
-            
-            invoice_ids_list = inv_df['invoice_id'].tolist()
-            
-            # 모든 항목 조회
-            if invoice_ids_list:
-                placeholders = ','.join(['?' for _ in invoice_ids_list])
-                items_df = pd.read_sql(
-                    f"SELECT invoice_id, item_name as 항목, qty as 수량, unit_price as 단가, amount as 금액, remark as 비고 FROM invoice_items WHERE invoice_id IN ({placeholders})",
-                    con, params=invoice_ids_list
-                )
-            else:
-                items_df = pd.DataFrame()
-            
-            # 회사 설정 조회
-            company_row = con.execute("""
-                SELECT company_name, business_number, address, business_type, business_item,
-                       bank_name, account_holder, account_number, representative
-                FROM company_settings WHERE id = 1
-            """).fetchone()
-        
+
+            # invoice_id 순으로 정렬된 스트림이라 groupby 한 번으로 그룹화 가능
+            query += " ORDER BY i.invoice_id DESC, it.rowid"
+
+            # 회사 설정은 모듈 캐시 사용 (설정 저장 시 무효화됨)
+            company_row = _company_settings()
+
+            # DataFrame/fetchall 없이 커서를 스트리밍으로 소비 — 전체 결과 리스트와
+            # 그룹 구조가 동시에 메모리에 존재하는 구간을 없앤다
+            con.row_factory = sqlite3.Row
+            cur = con.execute(query, params)
+            cur.arraysize = 1000
+
+            # 정렬된 결과를 인보이스별로 그룹화 (항목 없는 인보이스는 빈 목록)
+            from itertools import groupby
+            inv_groups = []
+            for _, grp in groupby(cur, key=lambda r: r['invoice_id']):
+                grp = list(grp)
+                items = [
+                    {'항목': g['항목'], '수량': g['수량'], '단가': g['단가'],
+                     '금액': g['금액'], '비고': g['비고']}
+                    for g in grp if g['항목'] is not None
+                ]
+                inv_groups.append((grp[0], items))
+
+        if not inv_groups:
+            raise HTTPException(status_code=404, detail="No invoices found")
+        inv_rows = [head for head, _ in inv_groups]
+
         # 회사 정보 설정
         if company_row:
             company_info = {
@@ -1433,7 +1626,7 @@ async def export_invoices_xlsx(
                 'business_type': '', 'business_item': '', 'bank_name': '',
                 'account_holder': '', 'account_number': '', 'representative': ''
             }
-        
+
         # 엑셀 워크북 생성
         wb = Workbook()
         
@@ -1441,14 +1634,10 @@ async def export_invoices_xlsx(
         ws_list = wb.active
         ws_list.title = "목록"
         
-        # 목록 스타일
-        header_font = Font(name='맑은 고딕', size=10, bold=True)
-        body_font = Font(name='맑은 고딕', size=9)
-        gray_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-        thin_border = Border(
-            left=Side(style='thin'), right=Side(style='thin'),
-            top=Side(style='thin'), bottom=Side(style='thin')
-        )
+        # 목록 스타일 (모듈 캐시)
+        S = _xlsx_styles()
+        header_font, body_font = S.header_font, S.body_font
+        gray_fill, thin_border = S.gray_fill, S.thin_border
         
         # 목록 헤더
         list_headers = ["인보이스ID", "업체명", "시작일", "종료일", "총액", "상태"]
@@ -1458,16 +1647,21 @@ async def export_invoices_xlsx(
             cell.fill = gray_fill
             cell.border = thin_border
         
-        # 목록 데이터
-        for row_idx, (_, row) in enumerate(inv_df.iterrows(), 2):
-            ws_list.cell(row=row_idx, column=1, value=int(row['invoice_id'])).border = thin_border
-            ws_list.cell(row=row_idx, column=2, value=str(row['vendor_name'])).border = thin_border
-            ws_list.cell(row=row_idx, column=3, value=str(row['period_from']) if row['period_from'] else '').border = thin_border
-            ws_list.cell(row=row_idx, column=4, value=str(row['period_to']) if row['period_to'] else '').border = thin_border
-            ws_list.cell(row=row_idx, column=5, value=f"₩ {int(row['total_amount']):,}" if pd.notna(row['total_amount']) else '').border = thin_border
-            ws_list.cell(row=row_idx, column=6, value=str(row['status'])).border = thin_border
-            for col in range(1, 7):
-                ws_list.cell(row=row_idx, column=col).font = body_font
+        # 목록 데이터 (행 단위 append 후 생성된 셀에 스타일 1회 적용 —
+        # ws.cell 재조회 루프보다 속성 접근이 절반)
+        for row in inv_rows:
+            ws_list.append((
+                int(row['invoice_id']),
+                str(row['vendor_name']),
+                str(row['period_from']) if row['period_from'] else '',
+                str(row['period_to']) if row['period_to'] else '',
+                int(row['total_amount']) if row['total_amount'] is not None else '',
+                str(row['status']),
+            ))
+            for cell in ws_list[ws_list.max_row]:
+                cell.border = thin_border
+                cell.font = body_font
+            ws_list.cell(row=ws_list.max_row, column=5).number_format = _WON_FMT
         
         # 목록 열 너비 조정
         ws_list.column_dimensions['A'].width = 12
@@ -1478,39 +1672,32 @@ async def export_invoices_xlsx(
         ws_list.column_dimensions['F'].width = 10
         
         # 각 인보이스별 시트 (PDF 양식)
-        for _, inv_row in inv_df.iterrows():
+        for inv_row, inv_items in inv_groups:
             iid = int(inv_row['invoice_id'])
             vendor_nm = str(inv_row['vendor_name'])[:15] if inv_row['vendor_name'] else 'Unknown'
             # 시트명에서 특수문자 제거
-            safe_vendor = re.sub(r'[\\/*?:\[\]]', '', vendor_nm)
+            safe_vendor = _SHEETNAME_BAD.sub('', vendor_nm)
             sheet_name = f"{safe_vendor}_{iid}"[:31]
-            
+
             # 새 시트 생성
             ws = wb.create_sheet(title=sheet_name)
-            
-            # 해당 인보이스 항목 필터링
-            inv_items = items_df[items_df['invoice_id'] == iid].copy()
-            
+
             # 인보이스 데이터 준비
             invoice_data = {
                 'invoice_id': iid,
                 'vendor_name': str(inv_row['vendor_name']) if inv_row['vendor_name'] else 'Unknown',
                 'period_from': str(inv_row['period_from']) if inv_row['period_from'] else '',
-                'confirmed_by': str(inv_row['confirmed_by']) if has_confirmed_by and pd.notna(inv_row.get('confirmed_by')) else ''
+                'confirmed_by': str(inv_row['confirmed_by']) if has_confirmed_by and inv_row['confirmed_by'] is not None else ''
             }
             
             # 시트 생성
             _create_invoice_sheet(ws, invoice_data, inv_items, company_info)
         
-        # 엑셀 저장
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
+        # 엑셀 저장 (청크 스트리밍)
         filename = f"invoices_{period if period else 'all'}.xlsx"
-        
+
         return StreamingResponse(
-            output,
+            _stream_workbook(wb),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
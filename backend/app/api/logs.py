@@ -16,22 +16,32 @@ router = APIRouter(prefix="/logs", tags=["logs"])
 # Helper Functions
 # ─────────────────────────────────────
 
+# CREATE TABLE을 로그 한 건마다 반복하지 않도록 프로세스 내 1회만 수행
+_LOGS_TABLE_READY = False
+
+_CREATE_LOGS_SQL = """
+    CREATE TABLE IF NOT EXISTS activity_logs (
+        log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        action_type TEXT NOT NULL,
+        target_type TEXT,
+        target_id TEXT,
+        target_name TEXT,
+        user_nickname TEXT,
+        details TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
 def ensure_logs_table():
     """activity_logs 테이블 생성"""
+    global _LOGS_TABLE_READY
+    if _LOGS_TABLE_READY:
+        return
     with get_connection() as con:
-        con.execute("""
-            CREATE TABLE IF NOT EXISTS activity_logs (
-                log_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                action_type TEXT NOT NULL,
-                target_type TEXT,
-                target_id TEXT,
-                target_name TEXT,
-                user_nickname TEXT,
-                details TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        con.execute(_CREATE_LOGS_SQL)
         con.commit()
+    _LOGS_TABLE_READY = True
 
 
 def add_log(
@@ -40,17 +50,27 @@ def add_log(
     target_id: str = None,
     target_name: str = None,
     user_nickname: str = None,
-    details: str = None
+    details: str = None,
+    con=None
 ):
-    """로그 추가"""
+    """로그 추가 (con을 넘기면 호출자의 트랜잭션에 함께 기록)"""
+    global _LOGS_TABLE_READY
+    insert_sql = """INSERT INTO activity_logs
+               (action_type, target_type, target_id, target_name, user_nickname, details)
+               VALUES (?, ?, ?, ?, ?, ?)"""
+    params = (action_type, target_type, target_id, target_name, user_nickname, details)
+
+    if con is not None:
+        # 호출자의 트랜잭션에 포함 — commit은 호출자 몫 (중간 commit 금지)
+        if not _LOGS_TABLE_READY:
+            con.execute(_CREATE_LOGS_SQL)
+            _LOGS_TABLE_READY = True
+        con.execute(insert_sql, params)
+        return
+
     ensure_logs_table()
     with get_connection() as con:
-        con.execute(
-            """INSERT INTO activity_logs 
-               (action_type, target_type, target_id, target_name, user_nickname, details) 
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (action_type, target_type, target_id, target_name, user_nickname, details)
-        )
+        con.execute(insert_sql, params)
         con.commit()
 
 
@@ -60,7 +80,7 @@ def add_log(
 
 @router.get("")
 @router.get("/")
-async def get_logs(
+def get_logs(
     token: str,
     period_from: Optional[str] = None,
     period_to: Optional[str] = None,
@@ -154,7 +174,7 @@ async def get_logs(
 
 
 @router.get("/stats")
-async def get_log_stats(token: str):
+def get_log_stats(token: str):
     """로그 통계 (관리자만)"""
     ensure_logs_table()
     
@@ -128,7 +128,11 @@ async def update_company_settings(settings: CompanySettings):
             settings.representative,
         ))
         con.commit()
-    
+
+    # 엑셀/PDF 내보내기가 들고 있는 회사 설정 캐시 무효화
+    from backend.app.api.invoices import _company_settings
+    _company_settings.cache_clear()
+
     return await get_company_settings()
 
 
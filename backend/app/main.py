@@ -76,7 +76,11 @@ async def startup_event():
     """앱 시작 시 DB 테이블 확인 및 스케줄러 시작."""
     from logic import ensure_tables
     ensure_tables()
-    
+
+    # 로그 테이블도 기동 시 1회 준비 (요청 경로의 반복 CREATE 제거)
+    from backend.app.api.logs import ensure_logs_table
+    ensure_logs_table()
+
     # 스케줄러 시작 (평일 오전 10시 인사)
     from backend.app.services.scheduler import start_scheduler
     start_scheduler()
@@ -622,29 +622,29 @@ def _save_work_log(args: Dict, user_id: str, user_name: str) -> Dict:
     
     with get_connection() as con:
         cursor = con.execute(
-            """INSERT INTO work_log 
+            """INSERT INTO work_log
                (날짜, 업체명, 분류, 단가, 수량, 합계, 비고1, 작성자, 저장시간, 출처, works_user_id)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             (date, vendor, work_type, unit_price, qty, total, remark, user_name, 저장시간, "bot", user_id)
         )
-        con.commit()
         record_id = cursor.lastrowid
-    
-    # 이력 기록
-    _log_work_history(record_id, "create", {
-        "날짜": date, "업체명": vendor, "분류": work_type,
-        "단가": unit_price, "수량": qty, "합계": total, "작성자": user_name
-    }, user_name, "봇 입력", user_id)
-    
-    # 활동 로그
-    add_log(
-        action_type="작업일지_생성",
-        target_type="work_log",
-        target_id=str(record_id),
-        target_name=f"{vendor} {work_type}",
-        user_nickname=user_name or "봇",
-        details=f"날짜: {date}, 합계: {total:,}원 (봇 입력)"
-    )
+
+        # 이력/활동 로그도 같은 트랜잭션에 기록 — 메시지당 commit(fsync) 1회
+        _log_work_history(record_id, "create", {
+            "날짜": date, "업체명": vendor, "분류": work_type,
+            "단가": unit_price, "수량": qty, "합계": total, "작성자": user_name
+        }, user_name, "봇 입력", user_id, con=con)
+
+        add_log(
+            action_type="작업일지_생성",
+            target_type="work_log",
+            target_id=str(record_id),
+            target_name=f"{vendor} {work_type}",
+            user_nickname=user_name or "봇",
+            details=f"날짜: {date}, 합계: {total:,}원 (봇 입력)",
+            con=con
+        )
+        con.commit()
     
     return {
         "success": True,
@@ -747,9 +747,9 @@ def _delete_work_log(args: Dict, user_id: str, user_name: str) -> Dict:
             "단가": row[4], "수량": row[5], "합계": row[6], "작성자": row[7]
         }
         
-        # 이력 기록
-        _log_work_history(log_id, "delete", log_data, user_name, "삭제", user_id)
-        
+        # 이력 기록 (삭제와 같은 트랜잭션)
+        _log_work_history(log_id, "delete", log_data, user_name, "삭제", user_id, con=con)
+
         # 삭제
         con.execute("DELETE FROM work_log WHERE id = ?", (log_id,))
         con.commit()
@@ -1609,30 +1609,34 @@ def _log_work_history(
     log_data: Dict,
     변경자: str = None,
     변경사유: str = None,
-    works_user_id: str = None
+    works_user_id: str = None,
+    con=None
 ):
-    """작업일지 변경 이력 기록"""
+    """작업일지 변경 이력 기록 (con을 넘기면 호출자의 트랜잭션에 함께 기록)"""
+    params = (
+        log_id, action,
+        log_data.get("날짜") or log_data.get("date"),
+        log_data.get("업체명") or log_data.get("vendor"),
+        log_data.get("분류") or log_data.get("work_type"),
+        log_data.get("단가") or log_data.get("unit_price"),
+        log_data.get("수량") or log_data.get("qty"),
+        log_data.get("합계") or (log_data.get("수량", 1) * log_data.get("단가", 0)),
+        log_data.get("작성자"),
+        변경자,
+        datetime.now().isoformat(),
+        변경사유,
+        works_user_id
+    )
+    insert_sql = """INSERT INTO work_log_history
+               (log_id, action, 날짜, 업체명, 분류, 단가, 수량, 합계, 작성자, 변경자, 변경시간, 변경사유, works_user_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
     try:
+        if con is not None:
+            # 호출자의 트랜잭션에 포함 — commit은 호출자 몫
+            con.execute(insert_sql, params)
+            return
         with get_connection() as con:
-            con.execute(
-                """INSERT INTO work_log_history 
-                   (log_id, action, 날짜, 업체명, 분류, 단가, 수량, 합계, 작성자, 변경자, 변경시간, 변경사유, works_user_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    log_id, action,
-                    log_data.get("날짜") or log_data.get("date"),
-                    log_data.get("업체명") or log_data.get("vendor"),
-                    log_data.get("분류") or log_data.get("work_type"),
-                    log_data.get("단가") or log_data.get("unit_price"),
-                    log_data.get("수량") or log_data.get("qty"),
-                    log_data.get("합계") or (log_data.get("수량", 1) * log_data.get("단가", 0)),
-                    log_data.get("작성자"),
-                    변경자,
-                    datetime.now().isoformat(),
-                    변경사유,
-                    works_user_id
-                )
-            )
+            con.execute(insert_sql, params)
             con.commit()
     except Exception as e:
         print(f"Warning: Could not log work history: {e}")
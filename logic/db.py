@@ -11,6 +11,7 @@ import textwrap
 import datetime as dt
 import pathlib
 import os
+import threading
 from contextlib import contextmanager
 
 import pandas as pd
@@ -67,14 +68,14 @@ DATE_FMT = "%Y-%m-%d %H:%M:%S"
 # ─────────────────────────────────────
 # 1. DB 연결
 # ─────────────────────────────────────
-@contextmanager
-def get_connection():
-    """로컬 'billing.db' 파일에 직접 연결합니다."""
+# 스레드별 커넥션 재사용 (WAL 모드라 스레드당 핸들 하나면 안전)
+_local = threading.local()
+
+
+def _open_connection(db_path: pathlib.Path) -> sqlite3.Connection:
+    """새 커넥션 생성 + 성능 프라그마 적용"""
     import time
-    
-    con = None
-    db_path = _resolve_db_path()
-    
+
     # 디렉토리 생성 보장 (Railway 볼륨 마운트 대기)
     max_retries = 5
     for attempt in range(max_retries):
@@ -86,23 +87,76 @@ def get_connection():
                 time.sleep(1)  # 볼륨 마운트 대기
             else:
                 print(f"Warning: Could not create directory {db_path.parent}: {e}")
-    
+
+    # cached_statements: 같은 SQL 텍스트 재실행 시 prepare 생략
+    con = sqlite3.connect(db_path, cached_statements=256)
+    # WAL 모드: 동시 읽기 성능 향상 & 안정성
+    con.execute("PRAGMA journal_mode=WAL;")
+    con.execute("PRAGMA busy_timeout=5000;")
+    # WAL에서는 NORMAL이면 충분 — 커밋마다 fsync하지 않아 쓰기 지연 감소
+    con.execute("PRAGMA synchronous=NORMAL;")
+    con.execute("PRAGMA temp_store=MEMORY;")
+    con.execute("PRAGMA mmap_size=268435456;")   # 256MB mmap 읽기
+    con.execute("PRAGMA cache_size=-65536;")     # 페이지 캐시 64MB
+    return con
+
+
+def _print_db_error(e: Exception, db_path: pathlib.Path) -> None:
+    """디버그 정보 출력"""
+    print(f"DB Error: {e}")
+    print(f"DB Path: {db_path}")
+    print(f"Parent exists: {db_path.parent.exists()}")
+    print(f"Parent is writable: {os.access(db_path.parent, os.W_OK) if db_path.parent.exists() else 'N/A'}")
+
+
+@contextmanager
+def get_connection():
+    """로컬 'billing.db' 파일에 연결합니다 (스레드별 커넥션 재사용).
+
+    매 호출마다 connect/close를 반복하지 않고 스레드당 하나의 핸들을
+    유지한다. 컨텍스트 종료 시 닫는 대신 미커밋 변경만 롤백해서
+    기존 '닫으면 미커밋 폐기' 동작을 그대로 유지한다.
+    """
+    db_path = _resolve_db_path()
+    con = getattr(_local, "con", None)
+
+    if con is None or getattr(_local, "db_path", None) != db_path:
+        if con is not None:
+            try:
+                con.close()
+            except sqlite3.Error:
+                pass
+        try:
+            con = _open_connection(db_path)
+        except sqlite3.OperationalError as e:
+            _print_db_error(e, db_path)
+            _local.con = None
+            raise
+        _local.con = con
+        _local.db_path = db_path
+
     try:
-        con = sqlite3.connect(db_path)
-        # WAL 모드: 동시 읽기 성능 향상 & 안정성
-        con.execute("PRAGMA journal_mode=WAL;")
-        con.execute("PRAGMA busy_timeout=5000;")
         yield con
     except sqlite3.OperationalError as e:
-        # 디버그 정보 출력
-        print(f"DB Error: {e}")
-        print(f"DB Path: {db_path}")
-        print(f"Parent exists: {db_path.parent.exists()}")
-        print(f"Parent is writable: {os.access(db_path.parent, os.W_OK) if db_path.parent.exists() else 'N/A'}")
+        # 에러난 핸들은 버리고 다음 호출에서 새로 연다
+        _print_db_error(e, db_path)
+        _local.con = None
+        try:
+            con.close()
+        except sqlite3.Error:
+            pass
         raise
     finally:
-        if con:
-            con.close()
+        if getattr(_local, "con", None) is con:
+            try:
+                con.row_factory = None  # 핸들 재사용 대비 원복
+                con.rollback()
+            except sqlite3.Error:
+                _local.con = None
+                try:
+                    con.close()
+                except sqlite3.Error:
+                    pass
 
 
 # ─────────────────────────────────────
@@ -347,7 +401,80 @@ def ensure_tables() -> None:
             for col, coltype in col_defs:
                 if col not in existing_cols:
                     con.execute(f"ALTER TABLE {tbl} ADD COLUMN {col} {coltype};")
-        
+
+        # 인보이스 거래처명 비정규화 컬럼 (목록/내보내기에서 vendors 조인 제거용)
+        invoice_cols = [c[1] for c in con.execute("PRAGMA table_info(invoices);")]
+        if "vendor_name_cached" not in invoice_cols:
+            try:
+                con.execute("ALTER TABLE invoices ADD COLUMN vendor_name_cached TEXT;")
+            except sqlite3.OperationalError:
+                pass
+
+        # 확정/수정자 추적 컬럼 (요청 경로마다 PRAGMA로 확인하던 것을 기동 시 1회로)
+        for col, coltype in (
+            ("modified_by", "TEXT"),
+            ("modified_at", "DATETIME"),
+            ("confirmed_by", "TEXT"),
+            ("confirmed_at", "DATETIME"),
+        ):
+            if col not in invoice_cols:
+                try:
+                    con.execute(f"ALTER TABLE invoices ADD COLUMN {col} {coltype};")
+                except sqlite3.OperationalError:
+                    pass
+        con.execute("""
+            UPDATE invoices SET vendor_name_cached = (
+                SELECT COALESCE(v.name, v.vendor) FROM vendors v
+                WHERE v.vendor_id = invoices.vendor_id
+            ) WHERE vendor_name_cached IS NULL
+        """)
+        con.executescript("""
+            CREATE TRIGGER IF NOT EXISTS trg_invoices_vendor_name_ai
+            AFTER INSERT ON invoices
+            BEGIN
+                UPDATE invoices SET vendor_name_cached = (
+                    SELECT COALESCE(v.name, v.vendor) FROM vendors v
+                    WHERE v.vendor_id = NEW.vendor_id
+                ) WHERE invoice_id = NEW.invoice_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_vendors_name_au
+            AFTER UPDATE OF name, vendor ON vendors
+            BEGIN
+                UPDATE invoices SET vendor_name_cached = COALESCE(NEW.name, NEW.vendor)
+                WHERE vendor_id = NEW.vendor_id;
+            END;
+        """)
+
+        # 조회 성능용 인덱스 (거래처 목록 DISTINCT / 거래처별 필터 / 기간 목록)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_shipping_vendor ON shipping_stats([공급처]);")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_invoices_period ON invoices(period_from);")
+        # 기간 필터(substr(period_from,1,7) = ?)가 인덱스를 타도록 표현식 인덱스 추가
+        con.execute("CREATE INDEX IF NOT EXISTS idx_invoices_period_ym ON invoices(substr(period_from, 1, 7));")
+        # vendors 필터(v.vendor/v.name)와 invoice_items 조인용 인덱스
+        # (vendors.vendor_id는 PK라 별도 인덱스 불필요)
+        con.execute("CREATE INDEX IF NOT EXISTS idx_vendors_vendor_name ON vendors(vendor, name);")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_invoice_items_invoice ON invoice_items(invoice_id);")
+        # 거래처별/상태별 인보이스 필터용
+        con.execute("CREATE INDEX IF NOT EXISTS idx_invoices_vendor ON invoices(vendor_id);")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_invoices_status ON invoices(status);")
+        # 거래처+기간 복합 필터용 (둘 다 걸렸을 때 단일 인덱스로 범위 좁힘)
+        con.execute(
+            "CREATE INDEX IF NOT EXISTS idx_invoices_vendor_period"
+            " ON invoices(vendor_id, substr(period_from, 1, 7));"
+        )
+
+        # 회사 설정 기본 레코드 (내보내기 경로에서 매번 확인/삽입하지 않도록 기동 시 보장)
+        con.execute("""
+            INSERT OR IGNORE INTO company_settings (id, company_name, business_number, address,
+                business_type, business_item, bank_name, account_holder, account_number, representative)
+            VALUES (1, '틸리언', '766-55-00323', '대구시 동구 첨단로8길 8 씨제이빌딩302호',
+                '서비스', '포장 및 충전업', '카카오뱅크', '장지훈', '3333-02-9946468', '장지훈')
+        """)
+
+        # 플래너가 새 인덱스를 쓰도록 통계 갱신
+        con.execute("ANALYZE;")
+
         con.commit()
 
 
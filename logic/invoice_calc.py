@@ -241,6 +241,13 @@ def create_and_finalize_invoice(
         )
         con.commit()
 
+    # 백엔드 목록 캐시 무효화 (FastAPI 밖에서 실행될 땐 조용히 건너뜀)
+    try:
+        from backend.app.api.invoices import _bump_invoices_version
+        _bump_invoices_version()
+    except ImportError:
+        pass
+
     return str(iid)
 
 
@@ -552,7 +552,8 @@ def create_billing_invoice_pdf(
     stamp_holder: str = "",
     manager: str = "",
     company_name: str = "",
-) -> bytes:
+    sink=None,
+) -> bytes | None:
     """
     물류대행 서비스 대금청구서 PDF 생성.
     
@@ -568,11 +569,12 @@ def create_billing_invoice_pdf(
         stamp_holder: 대표자명
         manager: 담당자명 (인보이스 확정자)
         company_name: 회사명 (하단에 표시)
-    
+        sink: 파일류 객체를 주면 거기에 직접 기록 (bytes 사본 없이 스트리밍용)
+
     Returns:
-        PDF 바이트 데이터
+        PDF 바이트 데이터 (sink를 준 경우 None)
     """
-    buffer = io.BytesIO()
+    buffer = sink if sink is not None else io.BytesIO()
     
     # 문서번호 생성
     doc_number = f"{invoice_id:05d}-{invoice_date.replace('-', '')[:6]}"
@@ -591,7 +593,9 @@ def create_billing_invoice_pdf(
         manager=manager,
         company_name=company_name,
     )
-    
+
+    if sink is not None:
+        return None
     buffer.seek(0)
     return buffer.getvalue()
 